@@ -1 +1,3 @@
 """Quantify Your Life - CLI tool for Track & Graph statistics."""
+
+__version__ = "0.1.0"
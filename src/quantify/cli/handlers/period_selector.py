@@ -1,6 +1,7 @@
 """Time period selection utilities for git stats."""
 
 from datetime import date, timedelta
+from functools import lru_cache
 
 import questionary
 
@@ -17,29 +18,37 @@ PERIOD_YEAR_BEFORE = "year_before"
 PERIOD_ALL_TIME = "all_time"
 
 
+@lru_cache(maxsize=8)
+def _year_labels(current_year: int) -> tuple[str, str, str]:
+    """Build the year-based period labels for a given current year.
+
+    Args:
+        current_year: The current calendar year.
+
+    Returns:
+        Tuple of (this year, last year, year before) labels.
+    """
+    return (
+        Constants.GIT_PERIOD_THIS_YEAR.format(year=current_year),
+        Constants.GIT_PERIOD_LAST_YEAR.format(year=current_year - 1),
+        Constants.GIT_PERIOD_YEAR_BEFORE.format(year=current_year - 2),
+    )
+
+
 def get_period_choices() -> list[questionary.Choice]:
     """Build period selection choices with year labels.
 
     Returns:
         List of questionary choices for period selection.
     """
-    current_year = date.today().year
+    this_year, last_year, year_before = _year_labels(date.today().year)
     return [
         questionary.Choice(title=Constants.GIT_PERIOD_LAST_7_DAYS, value=PERIOD_LAST_7_DAYS),
         questionary.Choice(title=Constants.GIT_PERIOD_LAST_30_DAYS, value=PERIOD_LAST_30_DAYS),
         questionary.Choice(title=Constants.GIT_PERIOD_LAST_12_MONTHS, value=PERIOD_LAST_12_MONTHS),
-        questionary.Choice(
-            title=Constants.GIT_PERIOD_THIS_YEAR.format(year=current_year),
-            value=PERIOD_THIS_YEAR,
-        ),
-        questionary.Choice(
-            title=Constants.GIT_PERIOD_LAST_YEAR.format(year=current_year - 1),
-            value=PERIOD_LAST_YEAR,
-        ),
-        questionary.Choice(
-            title=Constants.GIT_PERIOD_YEAR_BEFORE.format(year=current_year - 2),
-            value=PERIOD_YEAR_BEFORE,
-        ),
+        questionary.Choice(title=this_year, value=PERIOD_THIS_YEAR),
+        questionary.Choice(title=last_year, value=PERIOD_LAST_YEAR),
+        questionary.Choice(title=year_before, value=PERIOD_YEAR_BEFORE),
         questionary.Choice(title=Constants.GIT_PERIOD_ALL_TIME, value=PERIOD_ALL_TIME),
         questionary.Choice(title=Constants.MENU_BACK, value=None),
     ]
@@ -82,7 +91,7 @@ def get_period_label(period_key: str) -> str:
     Returns:
         Human-readable period label.
     """
-    current_year = date.today().year
+    this_year, last_year, year_before = _year_labels(date.today().year)
 
     if period_key == PERIOD_LAST_7_DAYS:
         return Constants.GIT_PERIOD_LAST_7_DAYS
@@ -91,11 +100,11 @@ def get_period_label(period_key: str) -> str:
     elif period_key == PERIOD_LAST_12_MONTHS:
         return Constants.GIT_PERIOD_LAST_12_MONTHS
     elif period_key == PERIOD_THIS_YEAR:
-        return Constants.GIT_PERIOD_THIS_YEAR.format(year=current_year)
+        return this_year
     elif period_key == PERIOD_LAST_YEAR:
-        return Constants.GIT_PERIOD_LAST_YEAR.format(year=current_year - 1)
+        return last_year
     elif period_key == PERIOD_YEAR_BEFORE:
-        return Constants.GIT_PERIOD_YEAR_BEFORE.format(year=current_year - 2)
+        return year_before
     else:
         return Constants.GIT_PERIOD_ALL_TIME
 
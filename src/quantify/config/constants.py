@@ -156,6 +156,9 @@ class Constants:
     LOG_BACKUP_COUNT: int = 3
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+    # Export
+    TEMPLATE_CACHE_DIR_NAME: str = "template_cache"
+
     # Project management
     PROJECT_SELECT_TITLE: str = "Select a project:"
     PROJECT_CREATE_NEW: str = "Create new project..."
@@ -13,6 +13,11 @@ class ConfigError(Exception):
     """Raised when configuration is invalid or missing."""
 
 
+# Settings parsed by Settings.load(), keyed by config path and validated
+# against the file's (mtime_ns, size) so edits are picked up
+_loaded_settings: dict[Path, tuple[tuple[int, int], "Settings"]] = {}
+
+
 # Source-specific configs
 
 
@@ -382,8 +387,18 @@ class Settings:
 
         config_path = base_dir / Constants.CONFIG_FILE_NAME
 
-        if not config_path.exists():
-            raise ConfigError(Constants.ERROR_CONFIG_NOT_FOUND.format(path=config_path))
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            raise ConfigError(
+                Constants.ERROR_CONFIG_NOT_FOUND.format(path=config_path)
+            ) from None
+
+        # Reuse the parsed settings while the file is unchanged
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = _loaded_settings.get(config_path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
 
         with open(config_path, encoding="utf-8") as f:
             try:
@@ -395,12 +410,15 @@ class Settings:
 
         # Check for new format vs old format
         if "sources" in data:
-            return cls._load_new_format(data)
+            settings = cls._load_new_format(data)
         elif "db_path" in data:
-            return cls._load_legacy_format(data)
+            settings = cls._load_legacy_format(data)
         else:
             raise ConfigError("Config must have either 'sources' or 'db_path'")
 
+        _loaded_settings[config_path] = (version, settings)
+        return settings
+
     @classmethod
     def load_project(
         cls,
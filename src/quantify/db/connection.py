@@ -1,8 +1,10 @@
 """SQLite database connection management."""
 
+import atexit
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from quantify.config.constants import Constants
 
@@ -14,6 +16,9 @@ class DatabaseError(Exception):
 class Database:
     """SQLite database connection manager."""
 
+    # Per-thread pool of shared databases keyed by path (see get_shared)
+    _pool: ClassVar[threading.local] = threading.local()
+
     def __init__(self, db_path: str) -> None:
         """Initialize database connection.
 
@@ -28,6 +33,41 @@ class Database:
             raise DatabaseError(Constants.ERROR_DB_NOT_FOUND.format(path=db_path))
         self._connection: sqlite3.Connection | None = None
 
+    @classmethod
+    def get_shared(cls, db_path: str) -> "Database":
+        """Get the database shared by all callers on the current thread.
+
+        Repositories created for the same path on one thread reuse a single
+        connection instead of each opening their own.
+
+        Args:
+            db_path: Path to the SQLite database file.
+
+        Returns:
+            Shared Database instance for this thread and path.
+
+        Raises:
+            DatabaseError: If database file not found.
+        """
+        shared: dict[str, Database] | None = getattr(cls._pool, "databases", None)
+        if shared is None:
+            shared = {}
+            cls._pool.databases = shared
+
+        db = shared.get(db_path)
+        if db is None:
+            db = cls(db_path)
+            shared[db_path] = db
+        return db
+
+    @classmethod
+    def _close_all(cls) -> None:
+        """Close all shared databases opened by the current thread."""
+        shared: dict[str, Database] = getattr(cls._pool, "databases", {})
+        for db in shared.values():
+            db.close()
+        shared.clear()
+
     def connect(self) -> sqlite3.Connection:
         """Get or create database connection.
 
@@ -54,8 +94,21 @@ class Database:
         cursor.execute(query, params)
         return cursor.fetchall()
 
+    def data_version(self) -> int:
+        """Return a token that changes whenever another connection commits.
+
+        Used to tell whether results cached from this connection are stale.
+
+        Returns:
+            SQLite's data_version for this connection.
+        """
+        return int(self.connect().execute("PRAGMA data_version").fetchone()[0])
+
     def close(self) -> None:
         """Close the database connection."""
         if self._connection is not None:
             self._connection.close()
             self._connection = None
+
+
+atexit.register(Database._close_all)
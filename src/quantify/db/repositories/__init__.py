@@ -1 +1,23 @@
 """Repository module for database access."""
+
+from quantify.db.connection import Database
+from quantify.db.repositories.datapoints import DataPointsRepository
+from quantify.db.repositories.features import FeaturesRepository
+from quantify.db.repositories.groups import GroupsRepository
+
+
+def open_all(
+    db: Database,
+) -> tuple[GroupsRepository, FeaturesRepository, DataPointsRepository]:
+    """Create all repositories on one database.
+
+    The repositories share the database's connection, and with it SQLite's
+    per-connection cache of compiled statements.
+
+    Args:
+        db: Database connection manager.
+
+    Returns:
+        Tuple of (groups, features, datapoints) repositories.
+    """
+    return GroupsRepository(db), FeaturesRepository(db), DataPointsRepository(db)
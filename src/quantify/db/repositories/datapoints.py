@@ -1,9 +1,14 @@
 """Repository for data_points_table operations."""
 
+import sqlite3
 from dataclasses import dataclass
+from functools import lru_cache
 
 from quantify.db.connection import Database
 
+# Selects the data points of all features in one group (parameter: group_id)
+_GROUP_FILTER = "feature_id IN (SELECT id FROM features_table WHERE group_id = ?)"
+
 
 @dataclass
 class DataPoint:
@@ -20,13 +25,14 @@ class DataPoint:
 class DataPointsRepository:
     """Repository for accessing data points."""
 
-    def __init__(self, db: Database) -> None:
+    def __init__(self, db: Database | str) -> None:
         """Initialize repository.
 
         Args:
-            db: Database connection manager.
+            db: Database connection manager, or a database path to use the
+                connection shared by the current thread.
         """
-        self._db = db
+        self._db = Database.get_shared(db) if isinstance(db, str) else db
 
     def get_sum_by_feature(
         self,
@@ -141,3 +147,169 @@ class DataPointsRepository:
         """
         rows = self._db.execute(query, tuple(params))
         return {row["feature_id"]: float(row["total"]) for row in rows}
+
+    def get_multi_period_sums(
+        self,
+        feature_ids: list[int],
+        periods: dict[str, tuple[int | None, int | None]],
+    ) -> dict[str, float]:
+        """Get sums for several time ranges in a single query.
+
+        Each range becomes one conditional SUM column, so the matching data
+        points are read once instead of once per range.
+
+        Args:
+            feature_ids: List of feature IDs to sum values for.
+            periods: Mapping of period name to (start, end) epoch milliseconds,
+                     both inclusive. None means no bound on that side.
+
+        Returns:
+            Dictionary mapping each period name to its sum of values.
+        """
+        if not feature_ids or not periods:
+            return dict.fromkeys(periods, 0.0)
+
+        bounds, params = _period_bounds(periods)
+        query = _build_multi_period_sql(bounds, _feature_ids_filter(len(feature_ids)))
+        rows = self._db.execute(query, (*params, *feature_ids))
+        return _period_sums_from_rows(periods, rows)
+
+    def get_multi_period_sums_by_group(
+        self,
+        group_id: int,
+        periods: dict[str, tuple[int | None, int | None]],
+    ) -> dict[str, float]:
+        """Get sums for several time ranges over all features in a group.
+
+        Like get_multi_period_sums(), but the group's features are selected
+        in SQL, so the feature list never has to be loaded first.
+
+        Args:
+            group_id: The group whose features to sum values for.
+            periods: Mapping of period name to (start, end) epoch milliseconds,
+                     both inclusive. None means no bound on that side.
+
+        Returns:
+            Dictionary mapping each period name to its sum of values.
+        """
+        if not periods:
+            return {}
+
+        bounds, params = _period_bounds(periods)
+        query = _build_multi_period_sql(bounds, _GROUP_FILTER)
+        rows = self._db.execute(query, (*params, group_id))
+        return _period_sums_from_rows(periods, rows)
+
+    def get_multi_feature_multi_period_sums(
+        self,
+        feature_ids: list[int],
+        periods: dict[str, tuple[int | None, int | None]],
+    ) -> dict[int, dict[str, float]]:
+        """Get sums for several time ranges for each feature individually.
+
+        Like get_multi_period_sums(), but grouped by feature, so stats for
+        many features come from one query.
+
+        Args:
+            feature_ids: List of feature IDs to sum values for.
+            periods: Mapping of period name to (start, end) epoch milliseconds,
+                     both inclusive. None means no bound on that side.
+
+        Returns:
+            Dictionary mapping every requested feature_id to its period sums.
+            Features without data points get zero for every period.
+        """
+        sums = {feature_id: dict.fromkeys(periods, 0.0) for feature_id in feature_ids}
+        if not feature_ids or not periods:
+            return sums
+
+        bounds, params = _period_bounds(periods)
+        query = _build_multi_period_sql(
+            bounds, _feature_ids_filter(len(feature_ids)), per_feature=True
+        )
+        for row in self._db.execute(query, (*params, *feature_ids)):
+            sums[row[0]] = {
+                name: float(value) for name, value in zip(periods, row[1:], strict=True)
+            }
+        return sums
+
+
+def _period_bounds(
+    periods: dict[str, tuple[int | None, int | None]],
+) -> tuple[tuple[tuple[bool, bool], ...], list[int]]:
+    """Split period ranges into their query shape and parameters.
+
+    Args:
+        periods: Mapping of period name to (start, end) epoch milliseconds.
+
+    Returns:
+        Tuple of ((has_start, has_end) per period, bound values in order).
+    """
+    bounds: list[tuple[bool, bool]] = []
+    params: list[int] = []
+    for start_epoch_milli, end_epoch_milli in periods.values():
+        bounds.append((start_epoch_milli is not None, end_epoch_milli is not None))
+        if start_epoch_milli is not None:
+            params.append(start_epoch_milli)
+        if end_epoch_milli is not None:
+            params.append(end_epoch_milli)
+    return tuple(bounds), params
+
+
+def _feature_ids_filter(count: int) -> str:
+    """Return a WHERE condition matching count feature ID parameters."""
+    return f"feature_id IN ({','.join('?' * count)})"
+
+
+@lru_cache(maxsize=64)
+def _build_multi_period_sql(
+    bounds: tuple[tuple[bool, bool], ...],
+    where: str,
+    per_feature: bool = False,
+) -> str:
+    """Build a query with one conditional SUM column per period.
+
+    Cached, so repeated stats queries reuse the same SQL text, which also
+    lets sqlite3's statement cache reuse the prepared statement.
+
+    Args:
+        bounds: (has_start, has_end) for each period, from _period_bounds().
+        where: Condition selecting the data points to sum.
+        per_feature: Whether to return one row per feature_id.
+
+    Returns:
+        SQL text taking the period bounds first, then the parameters of where.
+    """
+    columns: list[str] = []
+    for has_start, has_end in bounds:
+        conditions: list[str] = []
+        if has_start:
+            conditions.append("epoch_milli >= ?")
+        if has_end:
+            conditions.append("epoch_milli <= ?")
+
+        if conditions:
+            column = f"SUM(CASE WHEN {' AND '.join(conditions)} THEN value END)"
+        else:
+            column = "SUM(value)"
+        columns.append(f"COALESCE({column}, 0)")
+
+    if per_feature:
+        columns.insert(0, "feature_id")
+    group_by = "GROUP BY feature_id" if per_feature else ""
+    return f"""
+        SELECT {", ".join(columns)}
+        FROM data_points_table
+        WHERE {where}
+        {group_by}
+    """
+
+
+def _period_sums_from_rows(
+    periods: dict[str, tuple[int | None, int | None]],
+    rows: list[sqlite3.Row],
+) -> dict[str, float]:
+    """Map the single result row of a period sum query back to period names."""
+    if not rows:
+        return dict.fromkeys(periods, 0.0)
+    return {name: float(value) for name, value in zip(periods, rows[0], strict=True)}
@@ -19,13 +19,14 @@ class Group:
 class GroupsRepository:
     """Repository for accessing groups data."""
 
-    def __init__(self, db: Database) -> None:
+    def __init__(self, db: Database | str) -> None:
         """Initialize repository.
 
         Args:
-            db: Database connection manager.
+            db: Database connection manager, or a database path to use the
+                connection shared by the current thread.
         """
-        self._db = db
+        self._db = Database.get_shared(db) if isinstance(db, str) else db
 
     def get_all(self) -> list[Group]:
         """Get all groups ordered by display_index.
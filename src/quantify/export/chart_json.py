@@ -0,0 +1,21 @@
+"""JSON serialization of chart data for exported pages."""
+
+from typing import Any
+
+from jinja2.utils import htmlsafe_json_dumps
+from markupsafe import Markup
+
+
+def chart_json(value: Any) -> Markup:
+    """Serialize chart data once for embedding in an HTML attribute.
+
+    The result is already HTML-safe, so the template inserts it without
+    escaping each label again.
+
+    Args:
+        value: JSON-serializable chart labels, values or datasets.
+
+    Returns:
+        Compact, HTML-safe JSON markup.
+    """
+    return htmlsafe_json_dumps(value, separators=(",", ":"))
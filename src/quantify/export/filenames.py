@@ -0,0 +1,29 @@
+"""Filename helpers for exported files."""
+
+import re
+import string
+from functools import lru_cache
+
+# ASCII characters kept as-is in filenames; everything else becomes "_"
+_SAFE_ASCII_CHARS = frozenset(string.ascii_letters + string.digits + "-_")
+_SAFE_ASCII_TABLE = {code: "_" for code in range(128) if chr(code) not in _SAFE_ASCII_CHARS}
+# \w matches exactly the str.isalnum() characters plus "_"
+_UNSAFE_CHARS = re.compile(r"[^\w-]")
+
+
+@lru_cache(maxsize=256)
+def safe_filename(name: str) -> str:
+    """Replace characters that are not safe in filenames with underscores.
+
+    Letters and digits (including non-ASCII ones), "-" and "_" are kept.
+    Results are cached since the same item names come up on every export.
+
+    Args:
+        name: Name to sanitize.
+
+    Returns:
+        Sanitized name.
+    """
+    if name.isascii():
+        return name.translate(_SAFE_ASCII_TABLE)
+    return _UNSAFE_CHARS.sub("_", name)
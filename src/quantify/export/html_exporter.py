@@ -1,27 +1,116 @@
 """HTML exporter for statistics."""
 
+import os
 import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
+from typing import Any, Final
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
 from quantify.cli.handlers.period_selector import get_period_label
-from quantify.config.settings import ExportSettings
+from quantify.config.constants import Constants
+from quantify.config.settings import ExportEntry, ExportSettings
+from quantify.export.chart_json import chart_json
+from quantify.export.filenames import safe_filename
 from quantify.export.monthly_builder import build_monthly_chart_data
 from quantify.export.stats_builder import build_chart_data, build_stats_rows
 from quantify.export.top_features_exporter import export_top_features
 from quantify.services.monthly_stats import MonthlyStats
 from quantify.services.stats import TimeStats
-from quantify.sources.base import DisplayConfig
+from quantify.sources.base import ChartConfig, DataSource, DisplayConfig, SourceInfo
 from quantify.sources.excel.source import ExcelSource
 from quantify.sources.registry import SourceRegistry
 from quantify.sources.track_and_graph import TrackAndGraphSource
 
+# PHP authentication code prepended to every page in PHP mode
+_PHP_HEADER: Final = """<?php
+// Load config first (defines SIMPLE_LOGIN_PASSWORD constant)
+require_once __DIR__ . '/simple-login-config.php';
+
+// Load library files
+require_once __DIR__ . '/lib/simple-login/Session.php';
+require_once __DIR__ . '/lib/simple-login/SimpleLogin.php';
+
+use BenjaminKobjolke\\SimpleLogin\\SimpleLogin;
+
+SimpleLogin::requireAuth();
+?>
+"""
+_PHP_HEADER_BYTES: Final = _PHP_HEADER.encode("utf-8")
+
+# Write buffer for streamed pages and number of template events per chunk
+_WRITE_BUFFER_SIZE = 128 * 1024
+_STREAM_BUFFER_EVENTS = 64
+
+# Maximum number of pages rendered and written concurrently
+_MAX_EXPORT_WORKERS = 8
+
+# (unit, unit_label) for entry types that don't use their source's unit
+_ENTRY_TYPE_UNITS = {
+    "commits": ("commits", "commits"),
+    "projects_created": ("projects", "projects"),
+}
+
+# Static assets copied next to the exported pages, relative to static/
+_STATIC_SUB_DIRS = ("css", "js")
+_STATIC_FILES = (
+    "css/stats.css",
+    "js/chart.js",
+    "js/top_chart.js",
+    "js/monthly_chart.js",
+)
+
+
+def _copy_if_newer(src: Path, dst: Path) -> None:
+    """Copy a file unless the destination is already up to date.
+
+    Missing source files are skipped silently.
+
+    Args:
+        src: Source file path.
+        dst: Destination file path.
+    """
+    try:
+        src_mtime = src.stat().st_mtime_ns
+    except FileNotFoundError:
+        return
+    try:
+        if dst.stat().st_mtime_ns >= src_mtime:
+            return
+    except FileNotFoundError:
+        pass
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+@lru_cache(maxsize=64)
+def _resolve_chart_title(chart: ChartConfig | None, unit_label: str) -> str:
+    """Return the title of a stats page chart.
+
+    Args:
+        chart: Chart configuration, or None for the default periods chart.
+        unit_label: Unit label for display.
+
+    Returns:
+        The custom chart title, or a default one based on the chart type.
+    """
+    if chart and chart.title:
+        return chart.title
+    chart_type = chart.chart_type if chart else "periods"
+    if chart_type == "yearly":
+        return f"{unit_label.capitalize()} by Year"
+    return f"{unit_label.capitalize()} by Period"
+
 
 class HtmlExporter:
     """Exports statistics to HTML files."""
 
+    # Compiled templates are cached here across runs (same home dir as git stats cache)
+    TEMPLATE_CACHE_DIR = Path.home() / ".quantify-your-life" / Constants.TEMPLATE_CACHE_DIR_NAME
+
     def __init__(
         self,
         registry: SourceRegistry,
@@ -41,10 +130,30 @@ class HtmlExporter:
         self._templates_dir = templates_dir
         self._static_dir = static_dir
         self._php_login_lib_path = php_login_lib_path
+        self._ensured_dirs: set[Path] = set()
+        self.TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
         self._env = Environment(
             loader=FileSystemLoader(str(templates_dir)),
             autoescape=True,
+            # Templates don't change during an export run; keep every one compiled
+            auto_reload=False,
+            cache_size=-1,
+            bytecode_cache=FileSystemBytecodeCache(str(self.TEMPLATE_CACHE_DIR)),
+            trim_blocks=True,
+            lstrip_blocks=True,
         )
+        self._stats_template = self._env.get_template("stats.html")
+        self._index_template = self._env.get_template("index.html")
+
+    @cached_property
+    def _monthly_template(self) -> Template:
+        """Return the monthly comparison template, loaded on first use."""
+        return self._env.get_template("monthly_comparison.html")
+
+    @cached_property
+    def _top_features_template(self) -> Template:
+        """Return the top features template, loaded on first use."""
+        return self._env.get_template("top_features.html")
 
     def export(self, export_settings: ExportSettings) -> list[Path]:
         """Export configured entries to HTML.
@@ -56,11 +165,16 @@ class HtmlExporter:
             List of generated file paths.
         """
         output_dir = Path(export_settings.path)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(output_dir)
 
         # Copy static files
         self._copy_static_files(output_dir)
 
+        # Render variables shared by every page of this export
+        base_context: dict[str, Any] = {
+            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        }
+
         # Handle PHP mode setup
         php_mode = export_settings.php_mode
         if php_mode:
@@ -69,124 +183,234 @@ class HtmlExporter:
             self._copy_php_library(output_dir)
             self._generate_php_config(output_dir, export_settings.php_password)
 
-        generated_files: list[Path] = []
-        index_entries: list[dict[str, str]] = []
-
-        # Export each entry
-        for entry in export_settings.entries:
-            source = self._registry.get_by_id(entry.source)
-            if source is None:
-                continue
+        # Sources are queried here on the calling thread (their connections and
+        # progress output are not thread-safe); rendering and writing each page
+        # is handed to the pool so it overlaps with querying the next entry.
+        pages: list[tuple[str, Path | Future[Path]]] = []
+
+        # Resolve each source and its metadata once, even if many entries use it
+        sources = {
+            source_id: self._registry.get_by_id(source_id)
+            for source_id in dict.fromkeys(e.source for e in export_settings.entries)
+        }
+        source_infos = {
+            source_id: source.info for source_id, source in sources.items() if source is not None
+        }
+        item_names: dict[tuple[str, int | None, str], str | None] = {}
+        self._prefetch_feature_stats(sources, export_settings.entries)
+        max_workers = min(
+            _MAX_EXPORT_WORKERS, os.cpu_count() or 1, len(export_settings.entries) or 1
+        )
 
-            # Handle top_features entry type specially
-            if entry.entry_type == "top_features":
-                if not isinstance(source, TrackAndGraphSource):
-                    continue
-                if entry.entry_id is None or entry.period is None:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for entry in export_settings.entries:
+                source = sources[entry.source]
+                if source is None:
                     continue
+                page = self._export_entry(
+                    executor,
+                    entry,
+                    source,
+                    source_infos[entry.source],
+                    output_dir,
+                    base_context,
+                    php_mode,
+                    item_names,
+                )
+                if page is not None:
+                    pages.append(page)
 
-                # Get group name
-                group_name = source.get_item_name(entry.entry_id, "group")
-                if group_name is None:
-                    continue
+        # Collect results in entry order
+        display_names, written = zip(*pages, strict=True) if pages else ((), ())
+        generated_files = [page if isinstance(page, Path) else page.result() for page in written]
+        index_entries = [
+            {"name": display_name, "filename": file_path.name}
+            for display_name, file_path in zip(display_names, generated_files, strict=True)
+        ]
 
-                file_path = export_top_features(
-                    env=self._env,
-                    output_dir=output_dir,
-                    source=source,
-                    group_id=entry.entry_id,
-                    group_name=group_name,
-                    period_key=entry.period,
-                    php_mode=php_mode,
-                    php_wrapper_func=self._wrap_html_with_php if php_mode else None,
-                )
-                period_label = get_period_label(entry.period)
-                display_name = f"Top Features - {group_name} ({period_label})"
-                generated_files.append(file_path)
-                index_entries.append({"name": display_name, "filename": file_path.name})
-                continue
+        # Generate index page
+        index_path = self._export_index(output_dir, index_entries, base_context, php_mode=php_mode)
+        generated_files.insert(0, index_path)
 
-            # Handle monthly_comparison entry type
-            if entry.entry_type == "monthly_comparison":
-                if not isinstance(source, ExcelSource):
-                    continue
-                if not source.has_monthly_comparison:
-                    continue
+        return generated_files
 
-                monthly_stats = source.get_monthly_stats()
-                if monthly_stats is None:
-                    continue
+    @staticmethod
+    def _prefetch_feature_stats(
+        sources: dict[str, DataSource | None], entries: tuple[ExportEntry, ...]
+    ) -> None:
+        """Calculate stats for all Track & Graph feature entries in one batch.
 
-                # Get item name for monthly comparison
-                name = source.get_item_name(entry.entry_id, entry.entry_type)
-                if name is None:
-                    name = source.info.display_name
-
-                file_path = self._export_monthly_comparison(
-                    output_dir=output_dir,
-                    name=name,
-                    source_id=entry.source,
-                    stats=monthly_stats,
-                    custom_title=entry.title,
-                    php_mode=php_mode,
-                )
-                generated_files.append(file_path)
-                display_name = entry.title if entry.title else name
-                index_entries.append({"name": display_name, "filename": file_path.name})
+        The source caches the results, so the per-entry get_stats() calls
+        that follow no longer query each feature separately.
+
+        Args:
+            sources: Sources used by the export, keyed by source ID.
+            entries: Entries being exported.
+        """
+        for source_id, source in sources.items():
+            if not isinstance(source, TrackAndGraphSource):
                 continue
+            feature_ids = [
+                entry.entry_id
+                for entry in entries
+                if entry.source == source_id
+                and entry.entry_type == "feature"
+                and entry.entry_id is not None
+            ]
+            if len(feature_ids) > 1:
+                source.get_stats_for_features(feature_ids)
+
+    def _export_entry(
+        self,
+        executor: ThreadPoolExecutor,
+        entry: ExportEntry,
+        source: DataSource,
+        info: SourceInfo,
+        output_dir: Path,
+        base_context: dict[str, Any],
+        php_mode: bool,
+        item_names: dict[tuple[str, int | None, str], str | None],
+    ) -> tuple[str, Path | Future[Path]] | None:
+        """Query the data for one entry and schedule its page.
 
-            # Get item name
-            if hasattr(source, "get_item_name"):
-                name = source.get_item_name(entry.entry_id, entry.entry_type)
-            else:
-                items = source.get_selectable_items()
-                name = items[0].name if items else entry.source
+        Args:
+            executor: Pool that renders and writes the page.
+            entry: Export entry to process.
+            source: Data source of the entry.
+            info: Metadata of the source.
+            output_dir: Output directory path.
+            base_context: Template variables shared by all pages of the export.
+            php_mode: If True, output PHP file with authentication.
+            item_names: Item names already looked up during this export.
 
+        Returns:
+            Tuple of (index display name, written path or pending write), or
+            None if the entry is skipped.
+        """
+        # Handle top_features entry type specially
+        if entry.entry_type == "top_features":
+            if not isinstance(source, TrackAndGraphSource):
+                return None
+            if entry.entry_id is None or entry.period is None:
+                return None
+
+            # Get group name
+            group_name = self._get_item_name(
+                source, entry.source, entry.entry_id, "group", item_names
+            )
+            if group_name is None:
+                return None
+
+            # Queries the database while rendering, so it stays on this thread
+            file_path = export_top_features(
+                template=self._top_features_template,
+                output_dir=output_dir,
+                source=source,
+                group_id=entry.entry_id,
+                group_name=group_name,
+                period_key=entry.period,
+                php_mode=php_mode,
+                php_header=_PHP_HEADER_BYTES if php_mode else None,
+                generated_at=base_context["generated_at"],
+            )
+            period_label = get_period_label(entry.period)
+            display_name = f"Top Features - {group_name} ({period_label})"
+            return display_name, file_path
+
+        # Handle monthly_comparison entry type
+        if entry.entry_type == "monthly_comparison":
+            if not isinstance(source, ExcelSource):
+                return None
+            if not source.has_monthly_comparison:
+                return None
+
+            monthly_stats = source.get_monthly_stats()
+            if monthly_stats is None:
+                return None
+
+            # Get item name for monthly comparison
+            name = self._get_item_name(
+                source, entry.source, entry.entry_id, entry.entry_type, item_names
+            )
             if name is None:
-                continue
+                name = info.display_name
 
-            # Get stats
-            stats = source.get_stats(entry.entry_id, entry.entry_type)
-
-            # Determine unit based on entry type (for git stats commits/projects)
-            unit = source.info.unit
-            unit_label = source.info.unit_label
-            if entry.entry_type == "commits":
-                unit = "commits"
-                unit_label = "commits"
-            elif entry.entry_type == "projects_created":
-                unit = "projects"
-                unit_label = "projects"
-
-            # Export to HTML/PHP
-            file_path = self._export_stats(
+            future = executor.submit(
+                self._export_monthly_comparison,
                 output_dir=output_dir,
                 name=name,
-                entry_id=entry.entry_id,
-                entry_type=entry.entry_type,
                 source_id=entry.source,
-                stats=stats,
-                unit=unit,
-                unit_label=unit_label,
-                display_config=source.info.display_config,
+                stats=monthly_stats,
+                base_context=base_context,
                 custom_title=entry.title,
                 php_mode=php_mode,
             )
-            generated_files.append(file_path)
-            # Use custom title for index if provided
             display_name = entry.title if entry.title else name
-            index_entries.append({"name": display_name, "filename": file_path.name})
+            return display_name, future
 
-        # Generate index page
-        index_path = self._export_index(output_dir, index_entries, php_mode=php_mode)
-        generated_files.insert(0, index_path)
+        # Get item name
+        name = self._get_item_name(
+            source, entry.source, entry.entry_id, entry.entry_type, item_names
+        )
+        if name is None:
+            return None
+
+        # Get stats
+        stats = source.get_stats(entry.entry_id, entry.entry_type)
+
+        # Determine unit based on entry type (for git stats commits/projects)
+        unit, unit_label = _ENTRY_TYPE_UNITS.get(entry.entry_type, (info.unit, info.unit_label))
+
+        # Export to HTML/PHP
+        future = executor.submit(
+            self._export_stats,
+            output_dir=output_dir,
+            name=name,
+            entry_id=entry.entry_id,
+            entry_type=entry.entry_type,
+            source_id=entry.source,
+            stats=stats,
+            unit=unit,
+            unit_label=unit_label,
+            base_context=base_context,
+            display_config=info.display_config,
+            custom_title=entry.title,
+            php_mode=php_mode,
+        )
+        # Use custom title for index if provided
+        display_name = entry.title if entry.title else name
+        return display_name, future
 
-        return generated_files
+    @staticmethod
+    def _get_item_name(
+        source: DataSource,
+        source_id: str,
+        item_id: int | None,
+        item_type: str,
+        item_names: dict[tuple[str, int | None, str], str | None],
+    ) -> str | None:
+        """Look up an item name, at most once per export run.
+
+        Args:
+            source: Data source of the item.
+            source_id: Source identifier.
+            item_id: ID of the item.
+            item_type: Type of the item.
+            item_names: Item names already looked up during this export.
+
+        Returns:
+            The item name, or None if not found.
+        """
+        key = (source_id, item_id, item_type)
+        if key not in item_names:
+            item_names[key] = source.get_item_name(item_id, item_type)
+        return item_names[key]
 
     def _export_index(
         self,
         output_dir: Path,
         entries: list[dict[str, str]],
+        base_context: dict[str, Any],
         php_mode: bool = False,
     ) -> Path:
         """Generate index page with links to all exported stats.
@@ -194,58 +418,46 @@ class HtmlExporter:
         Args:
             output_dir: Output directory path.
             entries: List of dicts with 'name' and 'filename' keys.
+            base_context: Template variables shared by all pages of the export.
             php_mode: If True, output PHP file with authentication.
 
         Returns:
             Path to generated index file.
         """
-        template = self._env.get_template("index.html")
-
-        html_content = template.render(
-            entries=entries,
-            generated_at=datetime.now().strftime("%Y-%m-%d %H:%M"),
-        )
-
         extension = ".php" if php_mode else ".html"
         file_path = output_dir / f"index{extension}"
 
-        # Wrap with PHP authentication if enabled
-        content = self._wrap_html_with_php(html_content) if php_mode else html_content
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        self._render_to_file(
+            self._index_template,
+            file_path,
+            {**base_context, "entries": entries},
+            php_mode=php_mode,
+        )
 
         return file_path
 
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory once per exporter instance.
+
+        Args:
+            path: Directory to create, including missing parents.
+        """
+        if path in self._ensured_dirs:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(path)
+
     def _copy_static_files(self, output_dir: Path) -> None:
         """Copy static CSS and JS files to output directory.
 
         Args:
             output_dir: Output directory path.
         """
-        css_dir = output_dir / "css"
-        js_dir = output_dir / "js"
-
-        css_dir.mkdir(exist_ok=True)
-        js_dir.mkdir(exist_ok=True)
-
-        # Copy CSS files
-        src_css = self._static_dir / "css" / "stats.css"
-        if src_css.exists():
-            shutil.copy(src_css, css_dir / "stats.css")
-
-        # Copy JS files
-        src_js = self._static_dir / "js" / "chart.js"
-        if src_js.exists():
-            shutil.copy(src_js, js_dir / "chart.js")
+        for sub_dir in _STATIC_SUB_DIRS:
+            self._ensure_dir(output_dir / sub_dir)
 
-        src_top_js = self._static_dir / "js" / "top_chart.js"
-        if src_top_js.exists():
-            shutil.copy(src_top_js, js_dir / "top_chart.js")
-
-        src_monthly_js = self._static_dir / "js" / "monthly_chart.js"
-        if src_monthly_js.exists():
-            shutil.copy(src_monthly_js, js_dir / "monthly_chart.js")
+        for rel_path in _STATIC_FILES:
+            _copy_if_newer(self._static_dir / rel_path, output_dir / rel_path)
 
     def _copy_php_library(self, output_dir: Path) -> None:
         """Copy php-simple-login source files to output directory.
@@ -257,12 +469,10 @@ class HtmlExporter:
             return
 
         lib_dir = output_dir / "lib" / "simple-login"
-        lib_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(lib_dir)
 
         for filename in ("SimpleLogin.php", "Session.php"):
-            src = self._php_login_lib_path / "src" / filename
-            if src.exists():
-                shutil.copy(src, lib_dir / filename)
+            _copy_if_newer(self._php_login_lib_path / "src" / filename, lib_dir / filename)
 
     def _generate_php_config(self, output_dir: Path, password: str) -> None:
         """Generate simple-login-config.php with password.
@@ -282,29 +492,27 @@ define('SIMPLE_LOGIN_PASSWORD', '{password}');
         config_path = output_dir / "simple-login-config.php"
         config_path.write_text(content, encoding="utf-8")
 
-    def _wrap_html_with_php(self, html_content: str) -> str:
-        """Wrap HTML content with PHP authentication code.
+    def _render_to_file(
+        self,
+        template: Template,
+        file_path: Path,
+        context: dict[str, Any],
+        php_mode: bool = False,
+    ) -> None:
+        """Stream a rendered template into a file.
 
         Args:
-            html_content: Original HTML content.
-
-        Returns:
-            PHP file content with authentication.
+            template: Template to render.
+            file_path: Output file path.
+            context: Template variables.
+            php_mode: If True, prepend PHP authentication code.
         """
-        php_header = """<?php
-// Load config first (defines SIMPLE_LOGIN_PASSWORD constant)
-require_once __DIR__ . '/simple-login-config.php';
-
-// Load library files
-require_once __DIR__ . '/lib/simple-login/Session.php';
-require_once __DIR__ . '/lib/simple-login/SimpleLogin.php';
-
-use BenjaminKobjolke\\SimpleLogin\\SimpleLogin;
-
-SimpleLogin::requireAuth();
-?>
-"""
-        return php_header + html_content
+        stream = template.stream(context)
+        stream.enable_buffering(size=_STREAM_BUFFER_EVENTS)
+        with open(file_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            if php_mode:
+                f.write(_PHP_HEADER_BYTES)
+            stream.dump(f, encoding="utf-8")
 
     def _export_stats(
         self,
@@ -316,6 +524,7 @@ SimpleLogin::requireAuth();
         stats: TimeStats,
         unit: str,
         unit_label: str,
+        base_context: dict[str, Any],
         display_config: DisplayConfig | None = None,
         custom_title: str | None = None,
         php_mode: bool = False,
@@ -331,6 +540,7 @@ SimpleLogin::requireAuth();
             stats: Statistics to export.
             unit: Unit type ("time" or "distance").
             unit_label: Unit label for display.
+            base_context: Template variables shared by all pages of the export.
             display_config: Optional display configuration for filtering rows.
             custom_title: Optional custom page title (uses name if None).
             php_mode: If True, output PHP file with authentication.
@@ -338,58 +548,32 @@ SimpleLogin::requireAuth();
         Returns:
             Path to generated file.
         """
-        template = self._env.get_template("stats.html")
-
         title = custom_title if custom_title else name
         stats_rows = build_stats_rows(stats, unit, unit_label, display_config)
         chart_labels, chart_values = build_chart_data(stats, display_config)
 
-        # Build chart title
-        chart_title = None
-        if display_config and display_config.chart:
-            chart_title = display_config.chart.title
-        if not chart_title:
-            # Generate default title based on chart type
-            if display_config and display_config.chart:
-                chart_type = display_config.chart.chart_type
-            else:
-                chart_type = "periods"
-            if chart_type == "yearly":
-                chart_title = f"{unit_label.capitalize()} by Year"
-            else:
-                chart_title = f"{unit_label.capitalize()} by Period"
-
-        html_content = template.render(
-            title=title,
-            stats_rows=[
-                {
-                    "period": row.period,
-                    "value": row.value,
-                    "is_separator": row.is_separator,
-                    "trend_class": row.trend_class,
-                }
-                for row in stats_rows
-            ],
-            chart_labels=chart_labels,
-            chart_values=chart_values,
-            chart_title=chart_title,
-            unit=unit,
-            unit_label=unit_label,
-            generated_at=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        chart_title = _resolve_chart_title(
+            display_config.chart if display_config else None, unit_label
         )
 
         # Generate filename with appropriate extension
         extension = ".php" if php_mode else ".html"
-        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+        safe_name = safe_filename(name)
         entry_id_str = str(entry_id) if entry_id is not None else "all"
         filename = f"{source_id}_{entry_type}_{entry_id_str}_{safe_name}{extension}"
         file_path = output_dir / filename
 
-        # Wrap with PHP authentication if enabled
-        content = self._wrap_html_with_php(html_content) if php_mode else html_content
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        context = {
+            **base_context,
+            "title": title,
+            "stats_rows": stats_rows,
+            "chart_labels_json": chart_json(chart_labels),
+            "chart_values_json": chart_json(chart_values),
+            "chart_title": chart_title,
+            "unit": unit,
+            "unit_label": unit_label,
+        }
+        self._render_to_file(self._stats_template, file_path, context, php_mode=php_mode)
 
         return file_path
 
@@ -399,6 +583,7 @@ SimpleLogin::requireAuth();
         name: str,
         source_id: str,
         stats: MonthlyStats,
+        base_context: dict[str, Any],
         custom_title: str | None = None,
         php_mode: bool = False,
     ) -> Path:
@@ -409,14 +594,13 @@ SimpleLogin::requireAuth();
             name: Name of the item.
             source_id: Source identifier.
             stats: Monthly comparison statistics.
+            base_context: Template variables shared by all pages of the export.
             custom_title: Optional custom page title (uses name if None).
             php_mode: If True, output PHP file with authentication.
 
         Returns:
             Path to generated file.
         """
-        template = self._env.get_template("monthly_comparison.html")
-
         title = custom_title if custom_title else name
         chart_data = build_monthly_chart_data(stats)
 
@@ -424,25 +608,20 @@ SimpleLogin::requireAuth();
         unit_label = stats.unit_label or "Value"
         chart_title = f"Monthly {unit_label.capitalize()} by Year"
 
-        html_content = template.render(
-            title=title,
-            chart_labels=chart_data["labels"],
-            chart_datasets=chart_data["datasets"],
-            chart_title=chart_title,
-            unit_label=stats.unit_label,
-            generated_at=datetime.now().strftime("%Y-%m-%d %H:%M"),
-        )
-
         # Generate filename with appropriate extension
         extension = ".php" if php_mode else ".html"
-        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+        safe_name = safe_filename(name)
         filename = f"{source_id}_monthly_comparison_all_{safe_name}{extension}"
         file_path = output_dir / filename
 
-        # Wrap with PHP authentication if enabled
-        content = self._wrap_html_with_php(html_content) if php_mode else html_content
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        context = {
+            **base_context,
+            "title": title,
+            "chart_labels_json": chart_json(chart_data["labels"]),
+            "chart_datasets_json": chart_json(chart_data["datasets"]),
+            "chart_title": chart_title,
+            "unit_label": stats.unit_label,
+        }
+        self._render_to_file(self._monthly_template, file_path, context, php_mode=php_mode)
 
         return file_path
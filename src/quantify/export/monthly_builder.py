@@ -14,6 +14,17 @@ YEAR_COLORS = [
     ("rgba(54, 162, 235, 0.7)", "rgba(54, 162, 235, 1)"),  # Blue
 ]
 
+# Per-year Chart.js dataset styling, built once from YEAR_COLORS
+_YEAR_DATASET_STYLES = [
+    {
+        "backgroundColor": bg_color,
+        "borderColor": border_color,
+        "borderWidth": 1,
+        "borderRadius": 4,
+    }
+    for bg_color, border_color in YEAR_COLORS
+]
+
 
 def build_monthly_chart_data(stats: MonthlyStats) -> dict:
     """Build Chart.js grouped bar chart data from MonthlyStats.
@@ -31,21 +42,15 @@ def build_monthly_chart_data(stats: MonthlyStats) -> dict:
 
     # Build datasets (one per year, oldest first for left-to-right chronological order)
     sorted_years = sorted(stats.years)  # Sort ascending (oldest first)
-    datasets = []
-    for idx, year in enumerate(sorted_years):
-        color_idx = idx % len(YEAR_COLORS)
-        bg_color, border_color = YEAR_COLORS[color_idx]
-
-        values = stats.get_month_values(year)
-
-        datasets.append({
+    values_matrix = stats.get_values_matrix(sorted_years)
+    datasets = [
+        {
             "label": str(year),
             "data": values,
-            "backgroundColor": bg_color,
-            "borderColor": border_color,
-            "borderWidth": 1,
-            "borderRadius": 4,
-        })
+            **_YEAR_DATASET_STYLES[idx % len(_YEAR_DATASET_STYLES)],
+        }
+        for idx, (year, values) in enumerate(zip(sorted_years, values_matrix, strict=True))
+    ]
 
     return {
         "labels": labels,
@@ -1,14 +1,16 @@
 """Stats data builders for HTML export."""
 
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from itertools import chain
 
 from quantify.config.constants import Constants
 from quantify.services.stats import TimeStats, format_trend, format_value
 from quantify.sources.base import DisplayConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class StatsRow:
     """A row in the stats table."""
 
@@ -19,6 +21,47 @@ class StatsRow:
     key: str = ""  # Row key for filtering
 
 
+# CSS class for a trend value, indexed by ``value >= 0``.
+_TREND_CLASSES: tuple[str, str] = ("trend-negative", "trend-positive")
+
+# Static row layout around the dynamic yearly rows: (row key, period label, kind).
+# For "value" and "avg" rows the key is also the TimeStats attribute to display.
+_LEADING_ROWS: tuple[tuple[str, str, str], ...] = (
+    # Recent periods
+    ("last_7_days", Constants.PERIOD_LAST_7_DAYS, "value"),
+    ("last_31_days", Constants.PERIOD_LAST_31_DAYS, "value"),
+    ("_sep1", "", "separator"),
+    # Averages
+    ("avg_per_day_last_30_days", Constants.PERIOD_AVG_LAST_30_DAYS, "avg"),
+    ("trend_vs_previous_30_days", Constants.PERIOD_TREND_30_DAYS, "trend"),
+    ("_sep2", "", "separator"),
+    ("avg_per_day_last_12_months", Constants.PERIOD_AVG_LAST_12_MONTHS, "avg"),
+    ("avg_per_day_this_year", Constants.PERIOD_AVG_THIS_YEAR, "avg"),
+    ("avg_per_day_last_year", Constants.PERIOD_AVG_LAST_YEAR, "avg"),
+    ("_sep3", "", "separator"),
+)
+
+_TRAILING_ROWS: tuple[tuple[str, str, str], ...] = (
+    ("_sep4", "", "separator"),
+    # Standard periods
+    ("this_week", Constants.PERIOD_THIS_WEEK, "value"),
+    ("this_month", Constants.PERIOD_THIS_MONTH, "value"),
+    ("last_month", Constants.PERIOD_LAST_MONTH, "value"),
+    ("last_12_months", Constants.PERIOD_LAST_12_MONTHS, "value"),
+    ("total", Constants.PERIOD_TOTAL, "value"),
+)
+
+# Row keys of the most recent yearly totals; older years use "total_year_<year>"
+_YEAR_ROW_KEYS: tuple[str, ...] = ("total_this_year", "total_last_year", "total_year_before")
+
+# (label, row key) of the YoY rows after the two most recent years; older
+# years use "vs <previous year>" and "yoy_<year>"
+_NAMED_YOY_ROWS: tuple[tuple[str, str], ...] = (
+    (Constants.PERIOD_YOY_THIS_VS_LAST, "yoy_this_vs_last"),
+    (Constants.PERIOD_YOY_LAST_VS_YEAR_BEFORE, "yoy_last_vs_year_before"),
+)
+
+
 def build_stats_rows(
     stats: TimeStats,
     unit: str,
@@ -36,99 +79,35 @@ def build_stats_rows(
     Returns:
         List of stats rows for the template.
     """
-    hide_rows: Sequence[str] = display_config.hide_rows if display_config else ()
-    show_rows: Sequence[str] = display_config.show_rows if display_config else ()
-
-    def fmt(value: float) -> str:
-        return format_value(value, unit, unit_label)
-
-    def fmt_avg(value: float) -> str:
-        return format_value(value, unit, unit_label, is_avg=True)
-
-    def should_show(key: str) -> bool:
-        return key not in hide_rows
-
-    # Define all rows with their keys
-    all_rows: list[tuple[str, StatsRow]] = [
-        # Recent periods
-        (
-            "last_7_days",
-            StatsRow(Constants.PERIOD_LAST_7_DAYS, fmt(stats.last_7_days), key="last_7_days"),
-        ),
-        (
-            "last_31_days",
-            StatsRow(Constants.PERIOD_LAST_31_DAYS, fmt(stats.last_31_days), key="last_31_days"),
-        ),
-        ("_sep1", StatsRow("", "", is_separator=True)),
-        # Averages
-        ("avg_per_day_last_30_days", StatsRow(
-            Constants.PERIOD_AVG_LAST_30_DAYS,
-            fmt_avg(stats.avg_per_day_last_30_days),
-            key="avg_per_day_last_30_days",
-        )),
-        ("trend_vs_previous_30_days", _build_trend_row(stats)),
-        ("_sep2", StatsRow("", "", is_separator=True)),
-        ("avg_per_day_last_12_months", StatsRow(
-            Constants.PERIOD_AVG_LAST_12_MONTHS,
-            fmt_avg(stats.avg_per_day_last_12_months),
-            key="avg_per_day_last_12_months",
-        )),
-        ("avg_per_day_this_year", StatsRow(
-            Constants.PERIOD_AVG_THIS_YEAR,
-            fmt_avg(stats.avg_per_day_this_year),
-            key="avg_per_day_this_year",
-        )),
-        ("avg_per_day_last_year", StatsRow(
-            Constants.PERIOD_AVG_LAST_YEAR,
-            fmt_avg(stats.avg_per_day_last_year),
-            key="avg_per_day_last_year",
-        )),
-        ("_sep3", StatsRow("", "", is_separator=True)),
-    ]
-
-    # Build yearly totals dynamically from stats.yearly_totals
+    # Sets make the per-row membership checks constant time
+    hide_rows = frozenset(display_config.hide_rows) if display_config else frozenset()
+    show_rows = frozenset(display_config.show_rows) if display_config else frozenset()
     show_all_yoy = display_config.show_all_yoy if display_config else False
-    yearly_rows = _build_yearly_rows(stats, fmt, show_rows, show_all_yoy)
-    all_rows.extend(yearly_rows)
 
-    all_rows.append(("_sep4", StatsRow("", "", is_separator=True)))
+    fmt = _make_formatter(unit, unit_label, False)
+    fmt_avg = _make_formatter(unit, unit_label, True)
+
+    # Hidden rows are skipped before they are formatted; separators are
+    # collapsed as rows are emitted
+    candidates = chain(
+        _iter_layout_rows(_LEADING_ROWS, stats, fmt, fmt_avg, hide_rows),
+        # Yearly totals are built dynamically from stats.yearly_totals
+        _iter_yearly_rows(stats, fmt, hide_rows, show_rows, show_all_yoy),
+        _iter_layout_rows(_TRAILING_ROWS, stats, fmt, fmt_avg, hide_rows),
+    )
 
-    # Standard periods
-    all_rows.extend([
-        (
-            "this_week",
-            StatsRow(Constants.PERIOD_THIS_WEEK, fmt(stats.this_week), key="this_week"),
-        ),
-        (
-            "this_month",
-            StatsRow(Constants.PERIOD_THIS_MONTH, fmt(stats.this_month), key="this_month"),
-        ),
-        (
-            "last_month",
-            StatsRow(Constants.PERIOD_LAST_MONTH, fmt(stats.last_month), key="last_month"),
-        ),
-        (
-            "last_12_months",
-            StatsRow(
-                Constants.PERIOD_LAST_12_MONTHS, fmt(stats.last_12_months), key="last_12_months"
-            ),
-        ),
-        ("total", StatsRow(Constants.PERIOD_TOTAL, fmt(stats.total), key="total")),
-    ])
-
-    # Filter rows
     rows: list[StatsRow] = []
     prev_was_separator = True  # Start as True to avoid leading separator
 
-    for key, row in all_rows:
+    for row in candidates:
         if row.is_separator:
             # Only add separator if previous row wasn't a separator
-            if not prev_was_separator:
-                rows.append(row)
-                prev_was_separator = True
-        elif should_show(key):
-            rows.append(row)
+            if prev_was_separator:
+                continue
+            prev_was_separator = True
+        else:
             prev_was_separator = False
+        rows.append(row)
 
     # Remove trailing separator
     if rows and rows[-1].is_separator:
@@ -137,104 +116,114 @@ def build_stats_rows(
     return rows
 
 
-def _build_yearly_rows(
+@lru_cache(maxsize=32)
+def _make_formatter(unit: str, unit_label: str, is_avg: bool) -> Callable[[float], str]:
+    """Return a value formatter bound to a unit, shared across calls.
+
+    Args:
+        unit: Unit type ("time" or "distance").
+        unit_label: Unit label for display.
+        is_avg: If True, format values as averages.
+
+    Returns:
+        Function formatting a single value.
+    """
+    return partial(format_value, unit=unit, unit_label=unit_label, is_avg=is_avg)
+
+
+def _iter_layout_rows(
+    layout: tuple[tuple[str, str, str], ...],
     stats: TimeStats,
     fmt: Callable[[float], str],
-    show_rows: Sequence[str],
+    fmt_avg: Callable[[float], str],
+    hide_rows: frozenset[str],
+) -> Iterator[StatsRow]:
+    """Yield the visible rows of a static section of the row layout.
+
+    Args:
+        layout: Row layout entries as (key, label, kind) tuples.
+        stats: Statistics data.
+        fmt: Formatting function for values.
+        fmt_avg: Formatting function for averages.
+        hide_rows: Row keys to leave out.
+
+    Yields:
+        Stats rows in layout order, separators included.
+    """
+    for key, label, kind in layout:
+        if kind == "separator":
+            yield StatsRow("", "", is_separator=True)
+        elif key in hide_rows:
+            continue
+        elif kind == "trend":
+            yield _build_trend_row(stats)
+        else:
+            value: float = getattr(stats, key)
+            yield StatsRow(label, fmt_avg(value) if kind == "avg" else fmt(value), key=key)
+
+
+def _iter_yearly_rows(
+    stats: TimeStats,
+    fmt: Callable[[float], str],
+    hide_rows: frozenset[str],
+    show_rows: frozenset[str],
     show_all_yoy: bool = False,
-) -> list[tuple[str, StatsRow]]:
-    """Build yearly total rows dynamically from stats.yearly_totals.
+) -> Iterator[StatsRow]:
+    """Yield the visible yearly total rows from stats.yearly_totals.
 
     Args:
         stats: Statistics data with yearly_totals and yoy_percentages.
         fmt: Formatting function for values.
+        hide_rows: Row keys to leave out.
         show_rows: Rows to show (for YoY percentages).
         show_all_yoy: If True, show YoY percentage after every year.
 
-    Returns:
-        List of (key, StatsRow) tuples for yearly data.
+    Yields:
+        Stats rows for yearly data.
     """
-    rows: list[tuple[str, StatsRow]] = []
+    yearly_totals = stats.yearly_totals
+    year_count = len(yearly_totals)
+    # YoY rows only appear when requested, so skip the lookup otherwise
+    want_yoy = show_all_yoy or any(row.startswith("yoy_") for row in show_rows)
+    yoy_by_year: dict[int, float | None] = dict(stats.yoy_percentages) if want_yoy else {}
 
-    # Create a lookup for YoY percentages by year
-    yoy_by_year: dict[int, float | None] = {}
-    for year, pct in stats.yoy_percentages:
-        yoy_by_year[year] = pct
-
-    for idx, (year, total) in enumerate(stats.yearly_totals):
+    for idx, (year, total) in enumerate(yearly_totals):
         # Generate row key based on position (for backward compatibility)
-        if idx == 0:
-            key = "total_this_year"
-        elif idx == 1:
-            key = "total_last_year"
-        elif idx == 2:
-            key = "total_year_before"
-        else:
-            key = f"total_year_{year}"
+        key = _YEAR_ROW_KEYS[idx] if idx < len(_YEAR_ROW_KEYS) else f"total_year_{year}"
 
-        # Always use just the year as the label
-        label = str(year)
-
-        rows.append((key, StatsRow(label, fmt(total), key=key)))
+        if key not in hide_rows:
+            # Always use just the year as the label
+            yield StatsRow(str(year), fmt(total), key=key)
 
         # Add YoY row after this year if requested and available
         if year in yoy_by_year:
-            yoy_key = f"yoy_{year}"
-            if idx + 1 < len(stats.yearly_totals):
-                prev_year = stats.yearly_totals[idx + 1][0]
+            # Use predefined label for first two YoY rows for backward compatibility
+            if idx < len(_NAMED_YOY_ROWS):
+                yoy_label, row_key = _NAMED_YOY_ROWS[idx]
             else:
-                prev_year = year - 1
+                prev_year = yearly_totals[idx + 1][0] if idx + 1 < year_count else year - 1
+                yoy_label, row_key = f"vs {prev_year}", f"yoy_{year}"
 
             # Check if we should show this YoY row
-            should_show_yoy = show_all_yoy
-            if idx == 0:
-                should_show_yoy = should_show_yoy or "yoy_this_vs_last" in show_rows
-            elif idx == 1:
-                should_show_yoy = should_show_yoy or "yoy_last_vs_year_before" in show_rows
-            else:
-                should_show_yoy = should_show_yoy or f"yoy_{year}" in show_rows
-
-            if should_show_yoy:
-                # Use predefined label for first two YoY rows for backward compatibility
-                if idx == 0:
-                    yoy_label = Constants.PERIOD_YOY_THIS_VS_LAST
-                    row_key = "yoy_this_vs_last"
-                elif idx == 1:
-                    yoy_label = Constants.PERIOD_YOY_LAST_VS_YEAR_BEFORE
-                    row_key = "yoy_last_vs_year_before"
-                else:
-                    yoy_label = f"vs {prev_year}"
-                    row_key = yoy_key
-
-                yoy_row = _build_yoy_row(yoy_by_year[year], yoy_label, row_key)
-                rows.append((row_key, yoy_row))
-
-    return rows
+            if (show_all_yoy or row_key in show_rows) and row_key not in hide_rows:
+                yield _build_yoy_row(yoy_by_year[year], yoy_label, row_key)
 
 
 def _build_trend_row(stats: TimeStats) -> StatsRow:
     """Build the trend row with color class."""
-    trend_str = format_trend(stats.trend_vs_previous_30_days)
-    trend_class = ""
-    if stats.trend_vs_previous_30_days is not None:
-        is_positive = stats.trend_vs_previous_30_days >= 0
-        trend_class = "trend-positive" if is_positive else "trend-negative"
+    trend = stats.trend_vs_previous_30_days
     return StatsRow(
         Constants.PERIOD_TREND_30_DAYS,
-        trend_str,
-        trend_class=trend_class,
+        format_trend(trend),
+        trend_class=_TREND_CLASSES[trend >= 0] if trend is not None else "",
         key="trend_vs_previous_30_days",
     )
 
 
 def _build_yoy_row(value: float | None, label: str, key: str) -> StatsRow:
     """Build a year-over-year percentage row."""
-    trend_str = format_trend(value)
-    trend_class = ""
-    if value is not None:
-        is_positive = value >= 0
-        trend_class = "trend-positive" if is_positive else "trend-negative"
-    return StatsRow(label, trend_str, trend_class=trend_class, key=key)
+    trend_class = _TREND_CLASSES[value >= 0] if value is not None else ""
+    return StatsRow(label, format_trend(value), trend_class=trend_class, key=key)
 
 
 def build_chart_data(
@@ -256,9 +245,10 @@ def build_chart_data(
 
     if chart_type == "yearly":
         # Yearly totals chart (oldest year first, left to right)
-        labels = [str(year) for year, _ in stats.yearly_totals]
-        values = [total for _, total in stats.yearly_totals]
-        return labels[::-1], values[::-1]
+        if not stats.yearly_totals:
+            return [], []
+        years, totals = zip(*reversed(stats.yearly_totals), strict=True)
+        return [str(year) for year in years], list(totals)
 
     # Default periods chart
     labels = [
@@ -2,90 +2,190 @@
 
 import argparse
 import sys
+from dataclasses import dataclass
+from functools import cache, partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-
-from quantify.cli.export_config_menu import ExportConfigMenu
-from quantify.cli.menu import Menu
-from quantify.cli.project_selector import ProjectSelector
-from quantify.config.config_writer import ConfigWriter
+from quantify import __version__
 from quantify.config.constants import Constants
 from quantify.config.project_manager import ProjectManager
 from quantify.config.settings import ConfigError, Settings
-from quantify.export.html_exporter import HtmlExporter
 from quantify.services.logger import get_logger
-from quantify.sources.base import parse_display_config
-from quantify.sources.excel import ExcelSource
-from quantify.sources.git_stats import GitStatsSource
-from quantify.sources.hometrainer import HometrainerSource
-from quantify.sources.registry import SourceRegistry
-from quantify.sources.track_and_graph import TrackAndGraphSource
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from quantify.config.settings import (
+        ExcelSourceConfig,
+        GitStatsConfig,
+        HometrainerConfig,
+        TrackAndGraphConfig,
+    )
+    from quantify.sources.base import DataSource
+    from quantify.sources.registry import SourceRegistry
+
+
+def _create_track_and_graph_source(config: "TrackAndGraphConfig") -> "DataSource":
+    """Create the Track & Graph source from its settings.
+
+    Args:
+        config: Track & Graph source settings.
+
+    Returns:
+        The configured source.
+    """
+    from quantify.sources.base import parse_display_config
+    from quantify.sources.track_and_graph import TrackAndGraphSource
+
+    return TrackAndGraphSource(
+        db_path=config.db_path,
+        display_config=parse_display_config(config.display),
+    )
+
+
+def _create_hometrainer_source(config: "HometrainerConfig") -> "DataSource":
+    """Create the Hometrainer source from its settings.
+
+    Args:
+        config: Hometrainer source settings.
+
+    Returns:
+        The configured source.
+    """
+    from quantify.sources.base import parse_display_config
+    from quantify.sources.hometrainer import HometrainerSource
+
+    return HometrainerSource(
+        logs_path=config.logs_path,
+        unit=config.unit,
+        display_config=parse_display_config(config.display),
+    )
+
+
+def _create_git_stats_source(config: "GitStatsConfig") -> "DataSource":
+    """Create the Git Stats source from its settings.
+
+    Args:
+        config: Git Stats source settings.
+
+    Returns:
+        The configured source.
+    """
+    from quantify.sources.base import parse_display_config
+    from quantify.sources.git_stats import GitStatsSource
+
+    return GitStatsSource(
+        author=config.author,
+        root_paths=list(config.root_paths),
+        exclude_dirs=list(config.exclude_dirs),
+        exclude_extensions=list(config.exclude_extensions),
+        exclude_filenames=list(config.exclude_filenames),
+        display_config=parse_display_config(config.display),
+    )
+
+
+def _create_excel_source(source_id: str, config: "ExcelSourceConfig") -> "DataSource":
+    """Create one Excel source from its settings.
+
+    Args:
+        source_id: Unique ID of the Excel source.
+        config: Excel source settings.
+
+    Returns:
+        The configured source.
+    """
+    from quantify.sources.base import parse_display_config
+    from quantify.sources.excel import ExcelSource
+
+    return ExcelSource(
+        source_id=source_id,
+        name=config.name,
+        file_path=config.file_path,
+        tabs=config.tabs,
+        function=config.function,
+        unit_label=config.unit_label,
+        display_config=parse_display_config(config.display),
+        date_column=config.date_column,
+    )
 
 
-def _create_source_registry(settings: Settings) -> SourceRegistry:
+def _create_source_registry(settings: Settings) -> "SourceRegistry":
     """Create and populate source registry from settings.
 
+    Sources are registered as factories, so a source module is only imported
+    and the source only constructed once the registry hands it out.
+
     Args:
         settings: Application settings.
 
     Returns:
         SourceRegistry with all configured sources.
     """
+    from quantify.sources.registry import SourceRegistry
+
     registry = SourceRegistry()
 
     # Register Track & Graph source
     if settings.sources.track_and_graph:
-        tg_config = settings.sources.track_and_graph
-        tg_source = TrackAndGraphSource(
-            db_path=tg_config.db_path,
-            display_config=parse_display_config(tg_config.display),
+        registry.register_factory(
+            "track_and_graph",
+            partial(_create_track_and_graph_source, settings.sources.track_and_graph),
         )
-        registry.register(tg_source)
 
     # Register Hometrainer source
     if settings.sources.hometrainer:
-        ht_config = settings.sources.hometrainer
-        ht_source = HometrainerSource(
-            logs_path=ht_config.logs_path,
-            unit=ht_config.unit,
-            display_config=parse_display_config(ht_config.display),
+        registry.register_factory(
+            "hometrainer",
+            partial(_create_hometrainer_source, settings.sources.hometrainer),
         )
-        registry.register(ht_source)
 
     # Register Git Stats source
     if settings.sources.git_stats:
-        gs_config = settings.sources.git_stats
-        gs_source = GitStatsSource(
-            author=gs_config.author,
-            root_paths=list(gs_config.root_paths),
-            exclude_dirs=list(gs_config.exclude_dirs),
-            exclude_extensions=list(gs_config.exclude_extensions),
-            exclude_filenames=list(gs_config.exclude_filenames),
-            display_config=parse_display_config(gs_config.display),
+        registry.register_factory(
+            "git_stats",
+            partial(_create_git_stats_source, settings.sources.git_stats),
         )
-        registry.register(gs_source)
 
     # Register Excel sources
     if settings.sources.excel:
         for idx, excel_src in enumerate(settings.sources.excel.sources):
             # Create unique source ID for each Excel source
             source_id = f"excel_{idx}" if idx > 0 else "excel"
-            source = ExcelSource(
-                source_id=source_id,
-                name=excel_src.name,
-                file_path=excel_src.file_path,
-                tabs=excel_src.tabs,
-                function=excel_src.function,
-                unit_label=excel_src.unit_label,
-                display_config=parse_display_config(excel_src.display),
-                date_column=excel_src.date_column,
+            registry.register_factory(
+                source_id, partial(_create_excel_source, source_id, excel_src)
             )
-            registry.register(source)
 
     return registry
 
 
+# ANSI color codes for messages printed before Rich is loaded
+_ANSI_COLORS = {"red": "31", "yellow": "33"}
+
+
+def _print_error(message: str, color: str = "red") -> None:
+    """Print an early-exit message to stderr without loading Rich.
+
+    Args:
+        message: Message to print.
+        color: "red" or "yellow"; only applied when stderr is a terminal.
+    """
+    if sys.stderr.isatty():
+        message = f"\033[{_ANSI_COLORS[color]}m{message}\033[0m"
+    print(message, file=sys.stderr)
+
+
+@cache
+def _console() -> "Console":
+    """Return the Rich console shared by everything this process prints.
+
+    Rich is imported on first use, once the configuration checks have passed.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
 def _parse_args() -> argparse.Namespace:
     """Parse command-line arguments.
 
@@ -106,18 +206,21 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="List all available projects and exit",
     )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {__version__}",
+    )
     return parser.parse_args()
 
 
 def _resolve_project_context(
     args: argparse.Namespace,
-    console: Console,
 ) -> tuple[Path, Path | None] | None:
     """Resolve project and global config paths.
 
     Args:
         args: Parsed command-line arguments.
-        console: Console for output.
 
     Returns:
         Tuple of (config_dir, global_config_path_or_none), or None to exit.
@@ -129,27 +232,27 @@ def _resolve_project_context(
     if args.list_projects:
         projects = pm.discover_projects()
         if not projects:
-            console.print(f"[yellow]{Constants.PROJECT_NO_PROJECTS}[/yellow]")
+            print(Constants.PROJECT_NO_PROJECTS)
         else:
-            console.print("[bold]Available projects:[/bold]")
+            print("Available projects:")
             for p in projects:
                 status = "OK" if p.has_config else "missing config"
-                console.print(f"  {p.name} ({status})")
+                print(f"  {p.name} ({status})")
         return None
 
     # --project specified
     if args.project:
         project_path = pm.get_project_path(args.project)
         if not project_path.exists():
-            console.print(
-                f"[red]{Constants.PROJECT_NOT_FOUND.format(name=args.project)}[/red]"
-            )
+            _print_error(Constants.PROJECT_NOT_FOUND.format(name=args.project))
             return None
         global_config = pm.get_global_config_path()
         return project_path, global_config if global_config.exists() else None
 
     # Check if projects exist for interactive selection
     if pm.projects_exist():
+        from quantify.cli.project_selector import ProjectSelector
+
         selector = ProjectSelector(pm)
         selected = selector.select()
 
@@ -172,14 +275,12 @@ def _resolve_project_context(
 def _load_settings(
     config_dir: Path,
     global_config: Path | None,
-    console: Console,
 ) -> Settings | None:
     """Load settings from resolved project context.
 
     Args:
         config_dir: Directory containing config.json.
         global_config: Optional path to global config for merging.
-        console: Console for error output.
 
     Returns:
         Settings instance or None on error.
@@ -190,40 +291,105 @@ def _load_settings(
         else:
             return Settings.load(config_dir)
     except ConfigError as e:
-        console.print(f"[red]Configuration error: {e}[/red]")
+        _print_error(f"Configuration error: {e}")
         return None
 
 
-def main() -> int:
-    """Main entry point.
+@dataclass(frozen=True, slots=True)
+class _InstallPaths:
+    """Directories shipped next to the package, resolved once per process."""
 
-    Returns:
-        Exit code (0 for success, 1 for error).
+    templates_dir: Path
+    static_dir: Path
+    php_login_lib_dir: Path
+
+
+@cache
+def _install_paths() -> _InstallPaths:
+    """Resolve the install directories relative to this module.
+
+    Based on the module location, not cwd, so the paths work from any directory.
     """
-    logger = get_logger()
-    logger.info("Application started")
-    console = Console()
-    args = _parse_args()
+    base_dir = Path(__file__).parent.parent.parent
+    return _InstallPaths(
+        templates_dir=base_dir / "templates",
+        static_dir=base_dir / "static",
+        # PHP simple login library is expected as sibling directory
+        php_login_lib_dir=base_dir.parent / "php-simple-login",
+    )
+
+
+@dataclass(frozen=True)
+class _AppContext:
+    """Resolved project paths and the settings loaded from them."""
+
+    config_dir: Path
+    global_config: Path | None
+    settings: Settings
+
 
-    # Resolve project context
-    context = _resolve_project_context(args, console)
+def _load_app_context(args: argparse.Namespace) -> _AppContext | int:
+    """Resolve the project and load its settings once for an entry point.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Returns:
+        The loaded context, or the exit code if the command should stop.
+    """
+    context = _resolve_project_context(args)
     if context is None:
         return 0  # User chose to exit or list-projects was shown
 
     config_dir, global_config = context
 
-    # Load settings
-    settings = _load_settings(config_dir, global_config, console)
+    settings = _load_settings(config_dir, global_config)
     if settings is None:
         return 1
 
+    return _AppContext(config_dir, global_config, settings)
+
+
+def _create_checked_registry(settings: Settings) -> "SourceRegistry | None":
+    """Create the source registry and make sure it has a usable source.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        SourceRegistry with at least one configured source, or None.
+    """
     registry = _create_source_registry(settings)
+    if not registry.has_configured_sources():
+        _print_error(Constants.SOURCE_NO_CONFIGURED)
+        return None
+    return registry
 
-    if not registry.get_configured_sources():
-        console.print(f"[red]{Constants.SOURCE_NO_CONFIGURED}[/red]")
+
+def main() -> int:
+    """Main entry point.
+
+    Returns:
+        Exit code (0 for success, 1 for error).
+    """
+    args = _parse_args()
+    logger = get_logger()
+    logger.info("Application started")
+    # Resolve project context and load settings
+    app = _load_app_context(args)
+    if isinstance(app, int):
+        return app
+    settings = app.settings
+
+    registry = _create_checked_registry(settings)
+    if registry is None:
         return 1
 
+    console = _console()
+
     try:
+        from quantify.cli.menu import Menu
+
         menu = Menu(registry)
         menu.run()
     except KeyboardInterrupt:
@@ -240,32 +406,27 @@ def export_config() -> int:
     Returns:
         Exit code (0 for success, 1 for error).
     """
-    get_logger()  # Initialize logger to prevent console output
-    console = Console()
     args = _parse_args()
-
-    # Resolve project context
-    context = _resolve_project_context(args, console)
-    if context is None:
-        return 0  # User chose to exit or list-projects was shown
-
-    config_dir, global_config = context
-
-    # Load settings
-    settings = _load_settings(config_dir, global_config, console)
-    if settings is None:
+    get_logger()  # Initialize logger to prevent console output
+    # Resolve project context and load settings
+    app = _load_app_context(args)
+    if isinstance(app, int):
+        return app
+    settings = app.settings
+
+    registry = _create_checked_registry(settings)
+    if registry is None:
         return 1
 
-    registry = _create_source_registry(settings)
-
-    if not registry.get_configured_sources():
-        console.print(f"[red]{Constants.SOURCE_NO_CONFIGURED}[/red]")
-        return 1
+    console = _console()
 
     try:
+        from quantify.cli.export_config_menu import ExportConfigMenu
+        from quantify.config.config_writer import ConfigWriter
+
         config_writer = ConfigWriter(
-            config_dir / Constants.CONFIG_FILE_NAME,
-            global_config,
+            app.config_dir / Constants.CONFIG_FILE_NAME,
+            app.global_config,
         )
         menu = ExportConfigMenu(registry, config_writer)
         menu.run()
@@ -283,58 +444,50 @@ def export() -> int:
     Returns:
         Exit code (0 for success, 1 for error).
     """
-    get_logger()  # Initialize logger to prevent console output
-    console = Console()
-    # Get base_dir from module location, not cwd (so paths work from any directory)
-    base_dir = Path(__file__).parent.parent.parent
     args = _parse_args()
-
-    # Resolve project context
-    context = _resolve_project_context(args, console)
-    if context is None:
-        return 0  # User chose to exit or list-projects was shown
-
-    config_dir, global_config = context
-
-    # Load settings
-    settings = _load_settings(config_dir, global_config, console)
-    if settings is None:
-        return 1
+    get_logger()  # Initialize logger to prevent console output
+    # Resolve project context and load settings
+    app = _load_app_context(args)
+    if isinstance(app, int):
+        return app
+    settings = app.settings
 
     if settings.export is None:
-        console.print(f"[yellow]{Constants.EXPORT_NO_ENTRIES}[/yellow]")
+        _print_error(Constants.EXPORT_NO_ENTRIES, "yellow")
         return 1
 
     if not settings.export.path:
-        console.print(f"[yellow]{Constants.EXPORT_NO_PATH}[/yellow]")
+        _print_error(Constants.EXPORT_NO_PATH, "yellow")
         return 1
 
     if not settings.export.entries:
-        console.print(f"[yellow]{Constants.EXPORT_NO_ENTRIES}[/yellow]")
+        _print_error(Constants.EXPORT_NO_ENTRIES, "yellow")
         return 1
 
-    registry = _create_source_registry(settings)
+    paths = _install_paths()
+
+    # Determine PHP login library path if PHP mode is enabled
+    php_login_lib_path = None
+    if settings.export.php_mode:
+        php_login_lib_path = paths.php_login_lib_dir
+        if not php_login_lib_path.exists():
+            _print_error(f"PHP mode enabled but library not found at {php_login_lib_path}")
+            return 1
 
-    if not registry.get_configured_sources():
-        console.print(f"[red]{Constants.SOURCE_NO_CONFIGURED}[/red]")
+    # Sources and the exporter are only set up once the config is known to be usable
+    registry = _create_checked_registry(settings)
+    if registry is None:
         return 1
 
+    console = _console()
+
     try:
-        # Determine PHP login library path if PHP mode is enabled
-        php_login_lib_path = None
-        if settings.export.php_mode:
-            # PHP simple login library is expected as sibling directory
-            php_login_lib_path = base_dir.parent / "php-simple-login"
-            if not php_login_lib_path.exists():
-                console.print(
-                    f"[red]PHP mode enabled but library not found at {php_login_lib_path}[/red]"
-                )
-                return 1
+        from quantify.export.html_exporter import HtmlExporter
 
         exporter = HtmlExporter(
             registry=registry,
-            templates_dir=base_dir / "templates",
-            static_dir=base_dir / "static",
+            templates_dir=paths.templates_dir,
+            static_dir=paths.static_dir,
             php_login_lib_path=php_login_lib_path,
         )
 
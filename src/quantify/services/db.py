@@ -1,37 +1,57 @@
 """Thread-safe SQLite database connection manager."""
 
+import queue
 import sqlite3
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
 
+# Applied to every new connection: WAL with NORMAL sync avoids an fsync per
+# commit, and temp tables, page cache and memory-mapped reads stay in memory
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
 
 class ThreadLocalDB:
-    """Thread-safe SQLite database with thread-local connections.
+    """Thread-safe SQLite database with per-thread connections.
 
-    Each thread gets its own connection, avoiding SQLite's thread-safety issues.
-    Schema initialization is performed once on first connection from any thread.
+    Each thread works on its own connection, avoiding SQLite's thread-safety
+    issues. Connections borrowed through acquire() go back to a bounded pool
+    afterwards, so short-lived worker threads reuse them instead of opening
+    new ones. Schema initialization is performed once on first connection
+    from any thread.
 
     Usage:
         db = ThreadLocalDB(Path("data.db"), schema_init=create_tables)
-        conn = db.connection  # Get thread-local connection
-        conn.execute("SELECT * FROM table")
+        with db.acquire() as conn:  # Borrow a pooled connection
+            conn.execute("SELECT * FROM table")
+        conn = db.connection  # Or keep one for the current thread
     """
 
     def __init__(
         self,
         db_path: Path,
         schema_init: Callable[[sqlite3.Connection], None] | None = None,
+        pool_size: int = 8,
     ) -> None:
         """Initialize database manager.
 
         Args:
             db_path: Path to SQLite database file.
             schema_init: Optional callback to initialize schema on first connection.
+            pool_size: Maximum number of idle connections kept for reuse.
         """
         self._db_path = db_path
         self._schema_init = schema_init
         self._local = threading.local()
+        self._pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(maxsize=pool_size)
         self._schema_lock = threading.Lock()
         self._schema_initialized = False
 
@@ -39,25 +59,123 @@ class ThreadLocalDB:
     def connection(self) -> sqlite3.Connection:
         """Get thread-local database connection.
 
-        Creates a new connection for the current thread if needed.
-        Initializes schema on first connection from any thread.
+        Takes a pooled connection, or creates one, for the current thread if
+        needed. The thread keeps it until close() is called.
+        """
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._checkout()
+
+        return conn
+
+    @contextmanager
+    def acquire(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for the current thread.
+
+        Reuses the thread's current connection if it already holds one,
+        otherwise borrows one from the pool and returns it afterwards. An
+        unfinished transaction is rolled back if the block raises.
+
+        Yields:
+            Database connection owned by this thread for the block.
+        """
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None:
+            yield conn
+            return
+
+        conn = self._local.conn = self._checkout()
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            self._checkin(conn)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block in one explicit transaction.
+
+        Commits when the block finishes and rolls back if it raises. Inside a
+        transaction that is already open, the block joins it instead.
+
+        Yields:
+            Database connection owned by this thread for the block.
         """
-        if not hasattr(self._local, "conn") or self._local.conn is None:
-            self._db_path.parent.mkdir(parents=True, exist_ok=True)
-            self._local.conn = sqlite3.connect(str(self._db_path))
-            self._local.conn.row_factory = sqlite3.Row
-            self._ensure_schema()
+        with self.acquire() as conn:
+            if conn.in_transaction:
+                yield conn
+                return
+
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def bulk_execute(
+        self,
+        sql: str,
+        rows: Iterable[tuple],
+        chunk_size: int = 2000,
+    ) -> None:
+        """Execute SQL for many parameter tuples in a single transaction.
 
-        return self._local.conn
+        Prefer this over calling execute() and commit() in a loop, which
+        commits once per row. Rows are passed to executemany() in chunks, so
+        a generator is never fully materialized.
 
-    def _ensure_schema(self) -> None:
+        Args:
+            sql: SQL statement with parameter placeholders.
+            rows: Parameter tuples, one per execution.
+            chunk_size: Number of rows handed to executemany() at once.
+        """
+        iterator = iter(rows)
+        with self.transaction() as conn:
+            while chunk := list(islice(iterator, chunk_size)):
+                conn.executemany(sql, chunk)
+
+    def _checkout(self) -> sqlite3.Connection:
+        """Take an idle connection from the pool or open a new one."""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def _checkin(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection and make sure the schema exists.
+
+        Pooled connections move between threads, but only one thread uses a
+        connection at a time, so SQLite's same-thread check is disabled.
+        """
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        self._ensure_schema(conn)
+        return conn
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
         """Initialize schema once (thread-safe)."""
-        if self._schema_init is None:
+        # Checked again under the lock; once set, later connections skip it
+        if self._schema_init is None or self._schema_initialized:
             return
 
         with self._schema_lock:
             if not self._schema_initialized:
-                self._schema_init(self._local.conn)
+                self._schema_init(conn)
                 self._schema_initialized = True
 
     def execute(
@@ -81,7 +199,14 @@ class ThreadLocalDB:
         self.connection.commit()
 
     def close(self) -> None:
-        """Close current thread's connection."""
-        if hasattr(self._local, "conn") and self._local.conn is not None:
-            self._local.conn.close()
+        """Close current thread's connection and all idle pooled connections."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
             self._local.conn = None
+
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
@@ -1,6 +1,7 @@
 """Centralized logging with rotating file support."""
 
 import logging
+import threading
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Any
@@ -13,28 +14,40 @@ class Logger:
 
     _instance: "Logger | None" = None
     _initialized: bool = False
+    _lock = threading.Lock()
 
     # Use home dir for logs (same as cache)
     LOG_DIR = Path.home() / ".quantify-your-life" / Constants.LOG_DIR_NAME
 
     def __new__(cls) -> "Logger":
-        """Singleton pattern - one logger instance."""
+        """Singleton pattern - one logger instance, even under concurrent first use."""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
 
     def __init__(self) -> None:
         """Initialize logger (only runs once due to singleton)."""
         if Logger._initialized:
             return
-        Logger._initialized = True
+        with Logger._lock:
+            # Another thread may have finished initializing while we waited
+            if Logger._initialized:
+                return
 
-        self._log_dir = self.LOG_DIR
-        self._logger = logging.getLogger("quantify")
-        self._setup_handlers()
+            self._log_dir = self.LOG_DIR
+            self._logger = logging.getLogger("quantify")
+            self._setup_handlers()
+            Logger._initialized = True
 
     def _setup_handlers(self) -> None:
-        """Configure rotating file handler."""
+        """Configure rotating file handler.
+
+        The handler is attached right away, so records from module loggers
+        under "quantify" never fall through to stderr, but the log file is
+        only opened when the first record is written.
+        """
         self._log_dir.mkdir(parents=True, exist_ok=True)
         log_file = self._log_dir / Constants.LOG_FILE_NAME
 
@@ -42,6 +55,7 @@ class Logger:
             log_file,
             maxBytes=Constants.LOG_MAX_BYTES,
             backupCount=Constants.LOG_BACKUP_COUNT,
+            delay=True,
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(logging.Formatter(Constants.LOG_FORMAT))
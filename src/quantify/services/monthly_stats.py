@@ -1,7 +1,13 @@
 """Monthly comparison statistics."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 
+_MONTH_LABELS: tuple[str, ...] = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
+
 
 @dataclass
 class MonthlyStats:
@@ -21,10 +27,7 @@ class MonthlyStats:
     @property
     def month_labels(self) -> tuple[str, ...]:
         """Get month labels for chart display."""
-        return (
-            "Jan", "Feb", "Mar", "Apr", "May", "Jun",
-            "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
-        )
+        return _MONTH_LABELS
 
     def get_month_values(self, year: int) -> list[float]:
         """Get values for all 12 months for a specific year.
@@ -35,5 +38,33 @@ class MonthlyStats:
         Returns:
             List of 12 values (one per month), with 0.0 for missing months.
         """
-        year_data = self.data.get(year, {})
-        return [year_data.get(month, 0.0) for month in range(1, 13)]
+        return _month_row(self.data.get(year))
+
+    def get_values_matrix(self, years: Iterable[int]) -> list[list[float]]:
+        """Get the 12 monthly values for several years in one pass.
+
+        Args:
+            years: Years to get values for, in row order.
+
+        Returns:
+            One list of 12 values per year, with 0.0 for missing months.
+        """
+        data = self.data
+        return [_month_row(data.get(year)) for year in years]
+
+
+def _month_row(year_data: dict[int, float] | None) -> list[float]:
+    """Spread one year's sparse monthly sums over a 12-month row.
+
+    Args:
+        year_data: Sums by month (1-12), or None if the year has no data.
+
+    Returns:
+        List of 12 values (one per month), with 0.0 for missing months.
+    """
+    row = [0.0] * 12
+    if year_data:
+        for month, value in year_data.items():
+            if 1 <= month <= 12:
+                row[month - 1] = value
+    return row
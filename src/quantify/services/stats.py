@@ -8,6 +8,9 @@ This module keeps the format helpers for backwards compatibility
 and to centralize formatting logic.
 """
 
+from collections.abc import Callable
+from functools import lru_cache
+
 from quantify.services.stats_calculator import TimeStats
 
 # Re-export TimeStats for backwards compatibility
@@ -35,7 +38,19 @@ def format_duration(seconds: float) -> str:
     if seconds <= 0:
         return "0m"
 
-    total_minutes = int(seconds / 60)
+    return _format_minutes(int(seconds / 60))
+
+
+@lru_cache(maxsize=4096)
+def _format_minutes(total_minutes: int) -> str:
+    """Format whole minutes as hours and minutes, caching repeated values.
+
+    Args:
+        total_minutes: Duration in whole minutes.
+
+    Returns:
+        Formatted string like "5h 23m" or "45m".
+    """
     hours = total_minutes // 60
     minutes = total_minutes % 60
 
@@ -44,9 +59,12 @@ def format_duration(seconds: float) -> str:
     return f"{minutes}m"
 
 
+@lru_cache(maxsize=4096)
 def format_trend(percentage: float | None) -> str:
     """Format trend percentage.
 
+    Results are cached per value, since the same trends recur across pages.
+
     Args:
         percentage: Percentage change or None.
 
@@ -99,9 +117,7 @@ def format_commits(value: float, is_avg: bool = False) -> str:
     """
     if is_avg:
         return f"{value:,.1f} commits"
-    count = int(value)
-    suffix = "commit" if count == 1 else "commits"
-    return f"{count:,} {suffix}"
+    return _format_count(int(value), _COMMIT_SUFFIXES)
 
 
 def format_projects(value: float, is_avg: bool = False) -> str:
@@ -116,9 +132,26 @@ def format_projects(value: float, is_avg: bool = False) -> str:
     """
     if is_avg:
         return f"{value:,.1f} projects"
-    count = int(value)
-    suffix = "project" if count == 1 else "projects"
-    return f"{count:,} {suffix}"
+    return _format_count(int(value), _PROJECT_SUFFIXES)
+
+
+# Count suffixes indexed by ``count == 1``
+_COMMIT_SUFFIXES = ("commits", "commit")
+_PROJECT_SUFFIXES = ("projects", "project")
+
+
+@lru_cache(maxsize=1024)
+def _format_count(count: int, suffixes: tuple[str, str]) -> str:
+    """Format a whole count with its plural or singular suffix.
+
+    Args:
+        count: The count to format.
+        suffixes: (plural, singular) suffix pair.
+
+    Returns:
+        Formatted string like "1,234 commits" or "1 project".
+    """
+    return f"{count:,} {suffixes[count == 1]}"
 
 
 def format_value(value: float, unit: str, unit_label: str, is_avg: bool = False) -> str:
@@ -133,13 +166,21 @@ def format_value(value: float, unit: str, unit_label: str, is_avg: bool = False)
     Returns:
         Formatted string appropriate for the unit type.
     """
-    if unit == "time":
-        return format_duration(value)
-    elif unit == "lines":
-        return format_lines(value, is_avg)
-    elif unit == "commits":
-        return format_commits(value, is_avg)
-    elif unit == "projects":
-        return format_projects(value, is_avg)
-    else:
+    formatter = _UNIT_FORMATTERS.get(unit)
+    if formatter is None:
         return format_distance(value, unit_label)
+    return formatter(value, is_avg)
+
+
+def _format_time(value: float, is_avg: bool = False) -> str:
+    """Format a duration; averages use the same format as totals."""
+    return format_duration(value)
+
+
+# Formatters by unit type; any other unit is formatted as a distance
+_UNIT_FORMATTERS: dict[str, Callable[[float, bool], str]] = {
+    "time": _format_time,
+    "lines": format_lines,
+    "commits": format_commits,
+    "projects": format_projects,
+}
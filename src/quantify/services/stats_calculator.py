@@ -7,11 +7,16 @@ To add/remove time periods, modify this file only.
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import date, timedelta
+from functools import lru_cache
+from itertools import pairwise
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimeStats:
-    """Time statistics for all time periods. Used by ALL sources."""
+    """Time statistics for all time periods. Used by ALL sources.
+
+    Immutable, since sources cache and share the same instance between callers.
+    """
 
     # Recent periods
     last_7_days: float
@@ -64,9 +69,148 @@ class TimeStats:
         return self.yoy_percentages[1][1] if len(self.yoy_percentages) > 1 else None
 
 
+@lru_cache(maxsize=1)
+def _compute_date_ranges(today: date) -> dict[str, date]:
+    """Calculate all date boundaries.
+
+    This is the SINGLE SOURCE OF TRUTH for all time periods.
+    To add a new time period:
+    1. Add the date calculation here
+    2. Add the field to TimeStats
+    3. Add the period to _compute_periods()
+    4. Add the calculation in calculate()
+
+    Cached for the most recent day, so stats for many items share one set
+    of boundaries. The cache refreshes when the date changes.
+
+    Args:
+        today: The current date.
+
+    Returns:
+        Dictionary with date values for various time boundaries.
+        Shared between callers, so it must not be modified.
+    """
+    # Recent day ranges
+    days_7_ago = today - timedelta(days=7)
+    days_30_ago = today - timedelta(days=30)
+    days_31_ago = today - timedelta(days=31)
+    days_60_ago = today - timedelta(days=60)
+
+    # Start of this week (Monday)
+    week_start = today - timedelta(days=today.weekday())
+
+    # Start of this month
+    month_start = today.replace(day=1)
+
+    # Last month boundaries
+    last_month_end = month_start - timedelta(days=1)
+    last_month_start = last_month_end.replace(day=1)
+
+    # 12 months ago
+    months_12_ago = today - timedelta(days=365)
+
+    # This year
+    year_start = date(today.year, 1, 1)
+
+    # Last year
+    last_year_start = date(today.year - 1, 1, 1)
+    last_year_end = date(today.year - 1, 12, 31)
+
+    # Year before last
+    year_before_start = date(today.year - 2, 1, 1)
+    year_before_end = date(today.year - 2, 12, 31)
+
+    return {
+        "today": today,
+        "7_days_ago": days_7_ago,
+        "30_days_ago": days_30_ago,
+        "31_days_ago": days_31_ago,
+        "60_days_ago": days_60_ago,
+        "week_start": week_start,
+        "month_start": month_start,
+        "last_month_start": last_month_start,
+        "last_month_end": last_month_end,
+        "12_months_ago": months_12_ago,
+        "year_start": year_start,
+        "last_year_start": last_year_start,
+        "last_year_end": last_year_end,
+        "year_before_start": year_before_start,
+        "year_before_end": year_before_end,
+    }
+
+
+@lru_cache(maxsize=8)
+def _compute_periods(today: date, num_years: int) -> dict[str, tuple[date | None, date | None]]:
+    """Map each summed period to its (start_date, end_date) range.
+
+    Cached per day and number of years like _compute_date_ranges(), so
+    every item's stats are summed over the same shared period dict.
+
+    Args:
+        today: The current date.
+        num_years: Number of yearly totals to include.
+
+    Returns:
+        Dictionary mapping period names to inclusive date ranges.
+        Shared between callers, so it must not be modified.
+    """
+    ranges = _compute_date_ranges(today)
+    periods: dict[str, tuple[date | None, date | None]] = {
+        "last_7_days": (ranges["7_days_ago"], today),
+        "last_31_days": (ranges["31_days_ago"], today),
+        "last_30_days": (ranges["30_days_ago"], today),
+        "previous_30_days": (ranges["60_days_ago"], ranges["31_days_ago"]),
+        "last_12_months": (ranges["12_months_ago"], today),
+        "this_year": (ranges["year_start"], today),
+        "last_year": (ranges["last_year_start"], ranges["last_year_end"]),
+        "this_week": (ranges["week_start"], today),
+        "this_month": (ranges["month_start"], today),
+        "last_month": (ranges["last_month_start"], ranges["last_month_end"]),
+        "total": (None, None),
+    }
+
+    # Yearly totals: current year from Jan 1 to today, past years in full
+    for i in range(num_years):
+        year = today.year - i
+        year_end = today if i == 0 else date(year, 12, 31)
+        periods[_year_period(year)] = (date(year, 1, 1), year_end)
+
+    return periods
+
+
+@lru_cache(maxsize=1)
+def _compute_day_counts(today: date) -> dict[str, int]:
+    """Count the days in each period that is averaged per day.
+
+    Periods include both their first and last day, so every count is at
+    least 1, and leap years are counted with their actual length.
+
+    Args:
+        today: The current date.
+
+    Returns:
+        Dictionary mapping period names to their number of days.
+    """
+    ranges = _compute_date_ranges(today)
+    return {
+        "last_12_months": (today - ranges["12_months_ago"]).days + 1,
+        "this_year": (today - ranges["year_start"]).days + 1,
+        "last_year": (ranges["last_year_end"] - ranges["last_year_start"]).days + 1,
+    }
+
+
+def _year_period(year: int) -> str:
+    """Return the period name used for a yearly total."""
+    return f"year_{year}"
+
+
 # Type alias for the sum function that sources provide
 SumFunction = Callable[[date | None, date | None], float]
 
+# Type alias for an optional function that sums several named date ranges at once.
+# Receives {name: (start_date, end_date)} and returns {name: sum}.
+MultiSumFunction = Callable[[dict[str, tuple[date | None, date | None]]], dict[str, float]]
+
 
 class StatsCalculator:
     """Centralized stats calculation for all data sources.
@@ -83,7 +227,13 @@ class StatsCalculator:
         stats = calculator.calculate(my_source_get_sum)
     """
 
-    def calculate(self, get_sum: SumFunction, num_years: int = 3) -> TimeStats:
+    def calculate(
+        self,
+        get_sum: SumFunction,
+        num_years: int = 3,
+        get_sums: MultiSumFunction | None = None,
+        ranges: dict[str, date] | None = None,
+    ) -> TimeStats:
         """Calculate all statistics using the provided sum function.
 
         Args:
@@ -94,49 +244,55 @@ class StatsCalculator:
                      - If start_date is None, no lower bound.
                      - If end_date is None, use today.
             num_years: Number of years to calculate totals for (default: 3).
+            get_sums: Optional function that sums all periods in one call,
+                      for sources that can batch their queries. Falls back
+                      to one get_sum() call per period if not given.
+            ranges: Optional date boundaries from a previous call, so a caller
+                    computing stats for many items uses the same day for all.
 
         Returns:
             TimeStats with all calculated periods.
         """
-        ranges = self._get_date_ranges()
+        if ranges is None:
+            ranges = self._get_date_ranges()
+        periods = self._get_periods(ranges, num_years)
+        if get_sums is not None:
+            sums = get_sums(periods)
+        else:
+            # Periods can share a range (e.g. this_year and the current year's
+            # total), so each distinct range is summed only once
+            range_sums = {
+                date_range: get_sum(*date_range) for date_range in dict.fromkeys(periods.values())
+            }
+            sums = {name: range_sums[date_range] for name, date_range in periods.items()}
 
         # Recent periods
-        last_7_days = get_sum(ranges["7_days_ago"], ranges["today"])
-        last_31_days = get_sum(ranges["31_days_ago"], ranges["today"])
+        last_7_days = sums["last_7_days"]
+        last_31_days = sums["last_31_days"]
 
         # Last 30 days and previous 30 days for trend
-        last_30_days = get_sum(ranges["30_days_ago"], ranges["today"])
-        previous_30_days = get_sum(ranges["60_days_ago"], ranges["31_days_ago"])
+        last_30_days = sums["last_30_days"]
+        previous_30_days = sums["previous_30_days"]
 
         # Averages
         avg_last_30 = last_30_days / 30 if last_30_days else 0.0
         trend = self._calculate_trend(last_30_days, previous_30_days)
 
-        # Last 12 months (calculate actual days for leap year handling)
-        last_12_months_sum = get_sum(ranges["12_months_ago"], ranges["today"])
-        days_last_12_months = (ranges["today"] - ranges["12_months_ago"]).days + 1
-        avg_last_12_months = (
-            last_12_months_sum / days_last_12_months if days_last_12_months > 0 else 0.0
-        )
-
-        # This year
-        this_year_sum = get_sum(ranges["year_start"], ranges["today"])
-        days_this_year = (ranges["today"] - ranges["year_start"]).days + 1
-        avg_this_year = this_year_sum / days_this_year if days_this_year > 0 else 0.0
-
-        # Last year (calculate actual days for leap year handling)
-        last_year_sum = get_sum(ranges["last_year_start"], ranges["last_year_end"])
-        days_last_year = (ranges["last_year_end"] - ranges["last_year_start"]).days + 1
-        avg_last_year = last_year_sum / days_last_year if days_last_year > 0 else 0.0
+        # Per-day averages over the inclusive day counts of each period
+        day_counts = _compute_day_counts(ranges["today"])
+        last_12_months_sum = sums["last_12_months"]
+        avg_last_12_months = last_12_months_sum / day_counts["last_12_months"]
+        avg_this_year = sums["this_year"] / day_counts["this_year"]
+        avg_last_year = sums["last_year"] / day_counts["last_year"]
 
         # Standard periods
-        this_week = get_sum(ranges["week_start"], ranges["today"])
-        this_month = get_sum(ranges["month_start"], ranges["today"])
-        last_month = get_sum(ranges["last_month_start"], ranges["last_month_end"])
-        total = get_sum(None, None)
+        this_week = sums["this_week"]
+        this_month = sums["this_month"]
+        last_month = sums["last_month"]
+        total = sums["total"]
 
         # Calculate N years of totals dynamically
-        yearly_totals = self._calculate_yearly_totals(get_sum, num_years)
+        yearly_totals = self._calculate_yearly_totals(sums, num_years, ranges["today"])
         yoy_percentages = self._calculate_yoy_percentages(yearly_totals)
 
         return TimeStats(
@@ -156,37 +312,35 @@ class StatsCalculator:
             yoy_percentages=yoy_percentages,
         )
 
+    def _get_periods(
+        self, ranges: dict[str, date], num_years: int
+    ) -> dict[str, tuple[date | None, date | None]]:
+        """Map each summed period to its (start_date, end_date) range.
+
+        Args:
+            ranges: Date boundaries from _get_date_ranges().
+            num_years: Number of yearly totals to include.
+
+        Returns:
+            Dictionary mapping period names to inclusive date ranges.
+        """
+        return _compute_periods(ranges["today"], num_years)
+
     def _calculate_yearly_totals(
-        self, get_sum: SumFunction, num_years: int
+        self, sums: dict[str, float], num_years: int, today: date
     ) -> tuple[tuple[int, float], ...]:
-        """Calculate totals for N years.
+        """Collect totals for N years from the period sums.
 
         Args:
-            get_sum: Function to get sum for date range.
-            num_years: Number of years to calculate.
+            sums: Sums for the periods from _get_periods().
+            num_years: Number of years to collect.
+            today: Any day of the current year.
 
         Returns:
             Tuple of (year, total) pairs, newest to oldest.
         """
-        today = date.today()
-        current_year = today.year
-        yearly_totals: list[tuple[int, float]] = []
-
-        for i in range(num_years):
-            year = current_year - i
-            if i == 0:
-                # Current year: from Jan 1 to today
-                year_start = date(year, 1, 1)
-                year_end = today
-            else:
-                # Past years: full year
-                year_start = date(year, 1, 1)
-                year_end = date(year, 12, 31)
-
-            year_sum = get_sum(year_start, year_end)
-            yearly_totals.append((year, year_sum))
-
-        return tuple(yearly_totals)
+        years = range(today.year, today.year - num_years, -1)
+        return tuple((year, sums[_year_period(year)]) for year in years)
 
     def _calculate_yoy_percentages(
         self, yearly_totals: tuple[tuple[int, float], ...]
@@ -200,77 +354,18 @@ class StatsCalculator:
             Tuple of (year, percentage) pairs for each comparison.
             Entry at index i compares year[i] vs year[i+1].
         """
-        yoy_percentages: list[tuple[int, float | None]] = []
-
-        for i in range(len(yearly_totals) - 1):
-            current_year, current_total = yearly_totals[i]
-            _, previous_total = yearly_totals[i + 1]
-            pct = self._calculate_trend(current_total, previous_total)
-            yoy_percentages.append((current_year, pct))
-
-        return tuple(yoy_percentages)
+        return tuple(
+            (current_year, self._calculate_trend(current_total, previous_total))
+            for (current_year, current_total), (_, previous_total) in pairwise(yearly_totals)
+        )
 
     def _get_date_ranges(self) -> dict[str, date]:
-        """Calculate all date boundaries.
-
-        This is the SINGLE SOURCE OF TRUTH for all time periods.
-        To add a new time period:
-        1. Add the date calculation here
-        2. Add the field to TimeStats
-        3. Add the calculation in calculate()
+        """Return the date boundaries for today.
 
         Returns:
             Dictionary with date values for various time boundaries.
         """
-        today = date.today()
-
-        # Recent day ranges
-        days_7_ago = today - timedelta(days=7)
-        days_30_ago = today - timedelta(days=30)
-        days_31_ago = today - timedelta(days=31)
-        days_60_ago = today - timedelta(days=60)
-
-        # Start of this week (Monday)
-        week_start = today - timedelta(days=today.weekday())
-
-        # Start of this month
-        month_start = today.replace(day=1)
-
-        # Last month boundaries
-        last_month_end = month_start - timedelta(days=1)
-        last_month_start = last_month_end.replace(day=1)
-
-        # 12 months ago
-        months_12_ago = today - timedelta(days=365)
-
-        # This year
-        year_start = date(today.year, 1, 1)
-
-        # Last year
-        last_year_start = date(today.year - 1, 1, 1)
-        last_year_end = date(today.year - 1, 12, 31)
-
-        # Year before last
-        year_before_start = date(today.year - 2, 1, 1)
-        year_before_end = date(today.year - 2, 12, 31)
-
-        return {
-            "today": today,
-            "7_days_ago": days_7_ago,
-            "30_days_ago": days_30_ago,
-            "31_days_ago": days_31_ago,
-            "60_days_ago": days_60_ago,
-            "week_start": week_start,
-            "month_start": month_start,
-            "last_month_start": last_month_start,
-            "last_month_end": last_month_end,
-            "12_months_ago": months_12_ago,
-            "year_start": year_start,
-            "last_year_start": last_year_start,
-            "last_year_end": last_year_end,
-            "year_before_start": year_before_start,
-            "year_before_end": year_before_end,
-        }
+        return _compute_date_ranges(date.today())
 
     def _calculate_trend(self, current: float, previous: float) -> float | None:
         """Calculate percentage change between two periods.
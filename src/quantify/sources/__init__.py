@@ -1,7 +1,8 @@
 """Data sources package for quantify-your-life."""
 
+from typing import Any
+
 from quantify.sources.base import DataProvider, DataSource, SelectableItem, SourceInfo
-from quantify.sources.git_stats import GitStatsSource
 from quantify.sources.registry import SourceRegistry
 
 __all__ = [
@@ -12,3 +13,16 @@ __all__ = [
     "SourceInfo",
     "SourceRegistry",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import GitStatsSource on first access.
+
+    The git stats source pulls in Rich, so importing it eagerly would slow
+    down every import of a source submodule.
+    """
+    if name == "GitStatsSource":
+        from quantify.sources.git_stats import GitStatsSource
+
+        return GitStatsSource
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
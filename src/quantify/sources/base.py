@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import date
+from functools import lru_cache
 from typing import Any, Protocol
 
 from quantify.services.stats_calculator import TimeStats
@@ -56,12 +57,45 @@ def parse_display_config(config_dict: dict[str, Any] | None) -> DisplayConfig:
     """
     if not config_dict:
         return DisplayConfig()
+    return _parse_frozen_display_config(_freeze(config_dict))
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into hashable tuples.
+
+    Args:
+        value: A value parsed from the JSON config.
+
+    Returns:
+        The value with dicts as sorted (key, value) tuples and lists as tuples.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=64)
+def _parse_frozen_display_config(
+    frozen_config: tuple[tuple[str, Any], ...],
+) -> DisplayConfig:
+    """Parse a frozen display config, sharing results between identical configs.
+
+    Args:
+        frozen_config: Display config dictionary frozen by _freeze().
+
+    Returns:
+        DisplayConfig instance.
+    """
+    config_dict = dict(frozen_config)
+    chart = config_dict.get("chart")
     return DisplayConfig(
-        hide_rows=tuple(config_dict.get("hide_rows", [])),
-        show_rows=tuple(config_dict.get("show_rows", [])),
+        hide_rows=tuple(config_dict.get("hide_rows", ())),
+        show_rows=tuple(config_dict.get("show_rows", ())),
         show_years=config_dict.get("show_years", 3),
         show_all_yoy=config_dict.get("show_all_yoy", False),
-        chart=parse_chart_config(config_dict.get("chart")),
+        chart=parse_chart_config(dict(chart) if chart else None),
     )
 
 
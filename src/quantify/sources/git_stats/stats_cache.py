@@ -21,7 +21,8 @@ class GitStatsCache:
     - repo_path is stored as absolute path string for consistency
 
     Thread Safety:
-    - Uses ThreadLocalDB for thread-local connections
+    - Borrows a pooled ThreadLocalDB connection per operation, so
+      short-lived worker threads reuse connections
     - SQLite handles file-level locking for concurrent writes
     """
 
@@ -130,10 +131,11 @@ class GitStatsCache:
         if effective_end < start_date:
             return (0, 0, 0)
 
-        row = self._db.execute(
-            self._SQL_SUM,
-            (self._repo_key(repo_path), start_date.isoformat(), effective_end.isoformat()),
-        ).fetchone()
+        with self._db.acquire() as conn:
+            row = conn.execute(
+                self._SQL_SUM,
+                (self._repo_key(repo_path), start_date.isoformat(), effective_end.isoformat()),
+            ).fetchone()
 
         return (row["total_added"], row["total_removed"], row["total_commits"])
 
@@ -144,10 +146,11 @@ class GitStatsCache:
         end_date: date,
     ) -> set[date]:
         """Get set of dates already cached for this repo."""
-        rows = self._db.execute(
-            self._SQL_DATES,
-            (self._repo_key(repo_path), start_date.isoformat(), end_date.isoformat()),
-        ).fetchall()
+        with self._db.acquire() as conn:
+            rows = conn.execute(
+                self._SQL_DATES,
+                (self._repo_key(repo_path), start_date.isoformat(), end_date.isoformat()),
+            ).fetchall()
 
         return {date.fromisoformat(row["date"]) for row in rows}
 
@@ -190,11 +193,13 @@ class GitStatsCache:
             logger.debug(f"Skipping cache for today or future: {day}")
             return
 
-        self._db.execute(
-            self._SQL_UPSERT,
-            (self._repo_key(repo_path), day.isoformat(), stats.added, stats.removed, stats.commits),
-        )
-        self._db.commit()
+        repo_key = self._repo_key(repo_path)
+        with self._db.acquire() as conn:
+            conn.execute(
+                self._SQL_UPSERT,
+                (repo_key, day.isoformat(), stats.added, stats.removed, stats.commits),
+            )
+            conn.commit()
 
     def save_batch(
         self,
@@ -212,21 +217,22 @@ class GitStatsCache:
         ]
 
         if entries:
-            self._db.executemany(self._SQL_UPSERT, entries)
-            self._db.commit()
+            self._db.bulk_execute(self._SQL_UPSERT, entries)
 
     def clear_repo(self, repo_path: Path) -> None:
         """Remove all cached data for a repository."""
-        self._db.execute(
-            "DELETE FROM daily_stats WHERE repo_path = ?",
-            (self._repo_key(repo_path),),
-        )
-        self._db.commit()
+        with self._db.acquire() as conn:
+            conn.execute(
+                "DELETE FROM daily_stats WHERE repo_path = ?",
+                (self._repo_key(repo_path),),
+            )
+            conn.commit()
 
     def clear_all(self) -> None:
         """Remove all cached data."""
-        self._db.execute("DELETE FROM daily_stats")
-        self._db.commit()
+        with self._db.acquire() as conn:
+            conn.execute("DELETE FROM daily_stats")
+            conn.commit()
 
     def get_project_type(self, repo_path: Path) -> tuple[str, str] | None:
         """Get stored project type for a repository.
@@ -238,9 +244,10 @@ class GitStatsCache:
             Tuple of (project_type, type_source) or None if not stored.
             type_source is "auto" or "user".
         """
-        row = self._db.execute(
-            self._SQL_GET_PROJECT_TYPE, (self._repo_key(repo_path),)
-        ).fetchone()
+        with self._db.acquire() as conn:
+            row = conn.execute(
+                self._SQL_GET_PROJECT_TYPE, (self._repo_key(repo_path),)
+            ).fetchone()
         if row:
             return (row["project_type"], row["type_source"])
         return None
@@ -255,11 +262,12 @@ class GitStatsCache:
             project_type: The project type name (e.g., "unity", "flutter").
             type_source: Either "auto" (detected) or "user" (manually set).
         """
-        self._db.execute(
-            self._SQL_SET_PROJECT_TYPE,
-            (self._repo_key(repo_path), project_type, type_source),
-        )
-        self._db.commit()
+        with self._db.acquire() as conn:
+            conn.execute(
+                self._SQL_SET_PROJECT_TYPE,
+                (self._repo_key(repo_path), project_type, type_source),
+            )
+            conn.commit()
 
     def get_all_project_types(self) -> list[tuple[str, str, str, str]]:
         """Get all stored project types.
@@ -267,7 +275,8 @@ class GitStatsCache:
         Returns:
             List of (repo_path, project_type, type_source, detected_at) tuples.
         """
-        rows = self._db.execute(self._SQL_GET_ALL_PROJECT_TYPES).fetchall()
+        with self._db.acquire() as conn:
+            rows = conn.execute(self._SQL_GET_ALL_PROJECT_TYPES).fetchall()
         return [
             (row["repo_path"], row["project_type"], row["type_source"], row["detected_at"])
             for row in rows
@@ -279,9 +288,10 @@ class GitStatsCache:
         Args:
             repo_path: Path to the git repository.
         """
-        self._db.execute(self._SQL_DELETE_PROJECT_TYPE, (self._repo_key(repo_path),))
-        self._db.commit()
+        with self._db.acquire() as conn:
+            conn.execute(self._SQL_DELETE_PROJECT_TYPE, (self._repo_key(repo_path),))
+            conn.commit()
 
     def close(self) -> None:
-        """Close current thread's database connection."""
+        """Close current thread's and idle pooled database connections."""
         self._db.close()
@@ -1,5 +1,7 @@
 """Registry for managing data sources."""
 
+from collections.abc import Callable
+
 from quantify.sources.base import DataSource
 
 
@@ -7,12 +9,15 @@ class SourceRegistry:
     """Registry for managing available data sources.
 
     The registry holds references to all data sources and provides
-    methods to query configured sources.
+    methods to query configured sources. Sources can also be registered
+    as factories, which are only called when the source is first needed.
     """
 
     def __init__(self) -> None:
         """Initialize empty registry."""
-        self._sources: dict[str, DataSource] = {}
+        # None marks a source whose factory has not been called yet
+        self._sources: dict[str, DataSource | None] = {}
+        self._factories: dict[str, Callable[[], DataSource]] = {}
 
     def register(self, source: DataSource) -> None:
         """Register a data source.
@@ -21,6 +26,32 @@ class SourceRegistry:
             source: The data source to register.
         """
         self._sources[source.info.id] = source
+        self._factories.pop(source.info.id, None)
+
+    def register_factory(self, source_id: str, factory: Callable[[], DataSource]) -> None:
+        """Register a data source to be created on first use.
+
+        Args:
+            source_id: The identifier the created source will report.
+            factory: Callable creating the data source.
+        """
+        self._sources[source_id] = None
+        self._factories[source_id] = factory
+
+    def _materialize(self, source_id: str) -> DataSource:
+        """Return a registered source, creating it from its factory if needed.
+
+        Args:
+            source_id: ID of a registered source.
+
+        Returns:
+            The data source.
+        """
+        source = self._sources[source_id]
+        if source is None:
+            source = self._factories.pop(source_id)()
+            self._sources[source_id] = source
+        return source
 
     def get_by_id(self, source_id: str) -> DataSource | None:
         """Get a source by its ID.
@@ -31,7 +62,9 @@ class SourceRegistry:
         Returns:
             The source if found, None otherwise.
         """
-        return self._sources.get(source_id)
+        if source_id not in self._sources:
+            return None
+        return self._materialize(source_id)
 
     def get_all(self) -> list[DataSource]:
         """Get all registered sources.
@@ -39,7 +72,7 @@ class SourceRegistry:
         Returns:
             List of all registered sources.
         """
-        return list(self._sources.values())
+        return [self._materialize(source_id) for source_id in list(self._sources)]
 
     def get_configured_sources(self) -> list[DataSource]:
         """Get only sources that are properly configured.
@@ -47,9 +80,22 @@ class SourceRegistry:
         Returns:
             List of sources where is_configured() returns True.
         """
-        return [s for s in self._sources.values() if s.is_configured()]
+        return [s for s in self.get_all() if s.is_configured()]
+
+    def has_configured_sources(self) -> bool:
+        """Check whether at least one source is properly configured.
+
+        Stops at the first configured source, so later factories stay unused.
+
+        Returns:
+            True if any source's is_configured() returns True.
+        """
+        return any(
+            self._materialize(source_id).is_configured() for source_id in list(self._sources)
+        )
 
     def close_all(self) -> None:
-        """Close all registered sources."""
+        """Close all sources that have been created."""
         for source in self._sources.values():
-            source.close()
+            if source is not None:
+                source.close()
@@ -1,20 +1,36 @@
 """Data providers for Track & Graph source."""
 
-from datetime import UTC, date, datetime
+from datetime import date
 
 from quantify.db.repositories.datapoints import DataPointsRepository
 
+# Day boundaries are in UTC, so every day is exactly this long and epoch
+# milliseconds follow from the date's ordinal without datetime/timestamp calls
+_MILLIS_PER_DAY = 86_400_000
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
 
 def _date_to_epoch_milli(d: date) -> int:
     """Convert a date to epoch milliseconds at start of day UTC."""
-    dt = datetime(d.year, d.month, d.day, tzinfo=UTC)
-    return int(dt.timestamp() * 1000)
+    return (d.toordinal() - _EPOCH_ORDINAL) * _MILLIS_PER_DAY
 
 
 def _date_to_end_of_day_epoch_milli(d: date) -> int:
     """Convert a date to epoch milliseconds at end of day UTC."""
-    dt = datetime(d.year, d.month, d.day, 23, 59, 59, 999999, tzinfo=UTC)
-    return int(dt.timestamp() * 1000)
+    return _date_to_epoch_milli(d) + _MILLIS_PER_DAY - 1
+
+
+def _periods_to_epoch_milli(
+    periods: dict[str, tuple[date | None, date | None]],
+) -> dict[str, tuple[int | None, int | None]]:
+    """Convert inclusive date ranges to inclusive epoch millisecond ranges."""
+    return {
+        name: (
+            _date_to_epoch_milli(start_date) if start_date else None,
+            _date_to_end_of_day_epoch_milli(end_date) if end_date else None,
+        )
+        for name, (start_date, end_date) in periods.items()
+    }
 
 
 class FeatureDataProvider:
@@ -53,19 +69,34 @@ class FeatureDataProvider:
             end_epoch,
         )
 
+    def get_sums(self, periods: dict[str, tuple[date | None, date | None]]) -> dict[str, float]:
+        """Get sums of values for this feature in several date ranges at once.
+
+        Args:
+            periods: Mapping of period name to (start_date, end_date), with
+                     the same bounds as get_sum().
+
+        Returns:
+            Dictionary mapping each period name to its sum in seconds.
+        """
+        return self._repo.get_multi_period_sums(
+            [self._feature_id],
+            _periods_to_epoch_milli(periods),
+        )
+
 
 class GroupDataProvider:
     """Data provider for a group (aggregates all features in the group)."""
 
-    def __init__(self, repo: DataPointsRepository, feature_ids: list[int]) -> None:
+    def __init__(self, repo: DataPointsRepository, group_id: int) -> None:
         """Initialize provider.
 
         Args:
             repo: DataPoints repository instance.
-            feature_ids: List of feature IDs in the group.
+            group_id: The group ID whose features to query.
         """
         self._repo = repo
-        self._feature_ids = feature_ids
+        self._group_id = group_id
 
     def get_sum(
         self,
@@ -81,14 +112,61 @@ class GroupDataProvider:
         Returns:
             Sum of values in seconds.
         """
-        if not self._feature_ids:
-            return 0.0
+        return self.get_sums({"sum": (start_date, end_date)})["sum"]
 
-        start_epoch = _date_to_epoch_milli(start_date) if start_date else None
-        end_epoch = _date_to_end_of_day_epoch_milli(end_date) if end_date else None
+    def get_sums(self, periods: dict[str, tuple[date | None, date | None]]) -> dict[str, float]:
+        """Get sums of values for all features in several date ranges at once.
 
-        return self._repo.get_sum_by_features(
-            self._feature_ids,
-            start_epoch,
-            end_epoch,
+        Args:
+            periods: Mapping of period name to (start_date, end_date), with
+                     the same bounds as get_sum().
+
+        Returns:
+            Dictionary mapping each period name to its sum in seconds.
+        """
+        return self._repo.get_multi_period_sums_by_group(
+            self._group_id,
+            _periods_to_epoch_milli(periods),
         )
+
+
+class FeatureBatchSums:
+    """Period sums for many features, fetched together in one query.
+
+    The query runs on the first get_sums() call, and again only if a later
+    call asks for different periods.
+    """
+
+    def __init__(self, repo: DataPointsRepository, feature_ids: list[int]) -> None:
+        """Initialize batch.
+
+        Args:
+            repo: DataPoints repository instance.
+            feature_ids: Feature IDs to fetch sums for.
+        """
+        self._repo = repo
+        self._feature_ids = feature_ids
+        self._periods: dict[str, tuple[date | None, date | None]] | None = None
+        self._sums: dict[int, dict[str, float]] = {}
+
+    def get_sums(
+        self,
+        feature_id: int,
+        periods: dict[str, tuple[date | None, date | None]],
+    ) -> dict[str, float]:
+        """Get sums of values for one feature of the batch.
+
+        Args:
+            feature_id: A feature ID passed to the constructor.
+            periods: Mapping of period name to (start_date, end_date).
+
+        Returns:
+            Dictionary mapping each period name to its sum in seconds.
+        """
+        if periods != self._periods:
+            self._sums = self._repo.get_multi_feature_multi_period_sums(
+                self._feature_ids,
+                _periods_to_epoch_milli(periods),
+            )
+            self._periods = periods
+        return self._sums[feature_id]
@@ -1,9 +1,12 @@
 """Track & Graph data source implementation."""
 
+from collections import OrderedDict
 from datetime import date
+from functools import partial
 from pathlib import Path
 
 from quantify.db.connection import Database
+from quantify.db.repositories import open_all
 from quantify.db.repositories.datapoints import DataPointsRepository
 from quantify.db.repositories.features import FeaturesRepository
 from quantify.db.repositories.groups import GroupsRepository
@@ -16,12 +19,18 @@ from quantify.sources.base import (
     SourceInfo,
 )
 from quantify.sources.track_and_graph.data_provider import (
+    FeatureBatchSums,
     FeatureDataProvider,
     GroupDataProvider,
     _date_to_end_of_day_epoch_milli,
     _date_to_epoch_milli,
 )
 
+# Maximum number of TimeStats kept by get_stats(), least recently used dropped first
+_STATS_CACHE_SIZE = 1024
+
+_StatsKey = tuple[str | None, int | None]
+
 
 class TrackAndGraphSource(DataSource):
     """Data source for Track & Graph SQLite database."""
@@ -43,6 +52,8 @@ class TrackAndGraphSource(DataSource):
         self._groups_repo: GroupsRepository | None = None
         self._features_repo: FeaturesRepository | None = None
         self._datapoints_repo: DataPointsRepository | None = None
+        # (item_type, item_id) -> (day, data version, stats), oldest first
+        self._stats_cache: OrderedDict[_StatsKey, tuple[date, int, TimeStats]] = OrderedDict()
 
     @property
     def info(self) -> SourceInfo:
@@ -66,10 +77,8 @@ class TrackAndGraphSource(DataSource):
         if self._db is None:
             if not self._db_path:
                 raise RuntimeError("Track & Graph source not configured")
-            self._db = Database(self._db_path)
-            self._groups_repo = GroupsRepository(self._db)
-            self._features_repo = FeaturesRepository(self._db)
-            self._datapoints_repo = DataPointsRepository(self._db)
+            self._db = Database.get_shared(self._db_path)
+            self._groups_repo, self._features_repo, self._datapoints_repo = open_all(self._db)
 
     def get_selectable_items(self) -> list[SelectableItem]:
         """Return groups and features as selectable items."""
@@ -143,15 +152,25 @@ class TrackAndGraphSource(DataSource):
         Returns:
             DataProvider for calculating sums.
         """
+        return self._create_provider(item_id, item_type)
+
+    def _create_provider(
+        self, item_id: int | None, item_type: str | None
+    ) -> FeatureDataProvider | GroupDataProvider:
+        """Create the concrete data provider for a group or feature.
+
+        Args:
+            item_id: ID of the group or feature.
+            item_type: "group" or "feature".
+
+        Returns:
+            Provider that also supports batched sums via get_sums().
+        """
         self._ensure_connected()
         assert self._datapoints_repo is not None
-        assert self._features_repo is not None
 
         if item_type == "group" and item_id is not None:
-            # Get all feature IDs in this group
-            features = self._features_repo.get_by_group_id(item_id)
-            feature_ids = [f.id for f in features]
-            return GroupDataProvider(self._datapoints_repo, feature_ids)
+            return GroupDataProvider(self._datapoints_repo, item_id)
         elif item_type == "feature" and item_id is not None:
             return FeatureDataProvider(self._datapoints_repo, item_id)
         else:
@@ -162,6 +181,9 @@ class TrackAndGraphSource(DataSource):
     ) -> TimeStats:
         """Calculate statistics for the specified item.
 
+        Results are reused until the date changes or the database is
+        modified by another connection.
+
         Args:
             item_id: ID of the group or feature.
             item_type: "group" or "feature".
@@ -169,9 +191,78 @@ class TrackAndGraphSource(DataSource):
         Returns:
             TimeStats with all calculated periods.
         """
-        provider = self.get_data_provider(item_id, item_type)
+        provider = self._create_provider(item_id, item_type)
+        assert self._db is not None
+
+        key = (item_type, item_id)
+        today = date.today()
+        version = self._db.data_version()
+        stats = self._get_cached_stats(key, today, version)
+        if stats is None:
+            stats = StatsCalculator().calculate(
+                provider.get_sum,
+                self._display_config.show_years,
+                get_sums=provider.get_sums,
+            )
+            self._cache_stats(key, today, version, stats)
+        return stats
+
+    def get_stats_for_features(self, feature_ids: list[int]) -> dict[int, TimeStats]:
+        """Calculate statistics for several features at once.
+
+        Period sums for all features not already cached come from a single
+        query, instead of one query per feature. The results are cached like
+        those of get_stats().
+
+        Args:
+            feature_ids: IDs of the features.
+
+        Returns:
+            Dictionary mapping each feature ID to its TimeStats.
+        """
+        self._ensure_connected()
+        assert self._db is not None
+        assert self._datapoints_repo is not None
+
+        today = date.today()
+        version = self._db.data_version()
+        results: dict[int, TimeStats] = {}
+        missing: list[int] = []
+        for feature_id in dict.fromkeys(feature_ids):
+            stats = self._get_cached_stats(("feature", feature_id), today, version)
+            if stats is None:
+                missing.append(feature_id)
+            else:
+                results[feature_id] = stats
+
+        batch = FeatureBatchSums(self._datapoints_repo, missing)
         calculator = StatsCalculator()
-        return calculator.calculate(provider.get_sum, self._display_config.show_years)
+        for feature_id in missing:
+            provider = FeatureDataProvider(self._datapoints_repo, feature_id)
+            stats = calculator.calculate(
+                provider.get_sum,
+                self._display_config.show_years,
+                get_sums=partial(batch.get_sums, feature_id),
+            )
+            self._cache_stats(("feature", feature_id), today, version, stats)
+            results[feature_id] = stats
+
+        return results
+
+    def _get_cached_stats(self, key: _StatsKey, today: date, version: int) -> TimeStats | None:
+        """Return cached stats if they were calculated for this day and data version."""
+        cached = self._stats_cache.get(key)
+        if cached is None or cached[0] != today or cached[1] != version:
+            return None
+        self._stats_cache.move_to_end(key)
+        return cached[2]
+
+    def _cache_stats(self, key: _StatsKey, today: date, version: int, stats: TimeStats) -> None:
+        """Cache stats, dropping the least recently used entry when full."""
+        self._stats_cache[key] = (today, version, stats)
+        self._stats_cache.move_to_end(key)
+        if len(self._stats_cache) > _STATS_CACHE_SIZE:
+            self._stats_cache.popitem(last=False)
 
     def get_top_features_in_group(
         self,
@@ -224,6 +315,7 @@ class TrackAndGraphSource(DataSource):
         if self._db is not None:
             self._db.close()
             self._db = None
+            self._stats_cache.clear()
             self._groups_repo = None
             self._features_repo = None
             self._datapoints_repo = None
@@ -0,0 +1,54 @@
+"""Tests for Database connection sharing."""
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from quantify.db.connection import Database
+from quantify.db.repositories.groups import GroupsRepository
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Iterator[str]:
+    """Create an empty SQLite database file."""
+    path = tmp_path / "test.db"
+    sqlite3.connect(path).close()
+    yield str(path)
+    Database._close_all()
+
+
+def test_get_shared_reuses_database_on_same_thread(db_path: str) -> None:
+    """Test that repositories created from a path share one Database."""
+    shared = Database.get_shared(db_path)
+
+    assert Database.get_shared(db_path) is shared
+    assert GroupsRepository(db_path)._db is shared
+
+
+def test_get_shared_is_per_thread(db_path: str) -> None:
+    """Test that each thread gets its own shared Database."""
+    shared = Database.get_shared(db_path)
+    other: list[Database] = []
+
+    thread = threading.Thread(target=lambda: other.append(Database.get_shared(db_path)))
+    thread.start()
+    thread.join()
+
+    assert other[0] is not shared
+
+
+def test_data_version_changes_after_other_connection_commits(db_path: str) -> None:
+    """Test that a commit from another connection changes the data version."""
+    db = Database(db_path)
+    before = db.data_version()
+
+    other = sqlite3.connect(db_path)
+    other.execute("CREATE TABLE items (value INTEGER)")
+    other.commit()
+    other.close()
+
+    assert db.data_version() != before
+    db.close()
@@ -0,0 +1,101 @@
+"""Tests for DataPointsRepository aggregate queries."""
+
+import sqlite3
+from collections.abc import Iterator
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+import pytest
+
+from quantify.db.connection import Database
+from quantify.db.repositories.datapoints import (
+    DataPointsRepository,
+    _build_multi_period_sql,
+    _period_bounds,
+)
+from quantify.sources.track_and_graph.data_provider import (
+    _date_to_end_of_day_epoch_milli,
+    _date_to_epoch_milli,
+)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Iterator[DataPointsRepository]:
+    """Create a repository over a small data_points_table."""
+    path = tmp_path / "test.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE data_points_table (epoch_milli INTEGER, feature_id INTEGER, value REAL)"
+    )
+    conn.executemany(
+        "INSERT INTO data_points_table VALUES (?, ?, ?)",
+        [(100, 1, 1.5), (200, 1, 2.0), (300, 2, 4.0), (400, 3, 8.0)],
+    )
+    conn.commit()
+    conn.close()
+    db = Database(str(path))
+    yield DataPointsRepository(db)
+    db.close()
+
+
+def test_multi_period_sums_match_single_queries(repo: DataPointsRepository) -> None:
+    """Test that each batched period equals the sum from its own query."""
+    periods = {"early": (None, 200), "late": (200, 300), "total": (None, None)}
+
+    sums = repo.get_multi_period_sums([1, 2], periods)
+
+    assert sums == {
+        name: repo.get_sum_by_features([1, 2], start, end) for name, (start, end) in periods.items()
+    }
+    assert sums == {"early": 3.5, "late": 6.0, "total": 7.5}
+
+
+def test_multi_period_sums_without_features(repo: DataPointsRepository) -> None:
+    """Test that an empty feature list yields zero for every period."""
+    assert repo.get_multi_period_sums([], {"total": (None, None)}) == {"total": 0.0}
+
+
+def test_multi_period_sums_by_group(repo: DataPointsRepository) -> None:
+    """Test that group sums cover exactly the features in that group."""
+    conn = repo._db.connect()
+    conn.execute("CREATE TABLE features_table (id INTEGER, group_id INTEGER)")
+    conn.executemany("INSERT INTO features_table VALUES (?, ?)", [(1, 10), (2, 10), (3, 20)])
+    periods = {"late": (200, None), "total": (None, None)}
+
+    assert repo.get_multi_period_sums_by_group(10, periods) == repo.get_multi_period_sums(
+        [1, 2], periods
+    )
+    assert repo.get_multi_period_sums_by_group(30, periods) == {"late": 0.0, "total": 0.0}
+
+
+def test_multi_feature_multi_period_sums(repo: DataPointsRepository) -> None:
+    """Test that per-feature batched sums match the per-feature queries."""
+    periods = {"early": (None, 250), "total": (None, None)}
+
+    sums = repo.get_multi_feature_multi_period_sums([1, 2, 9], periods)
+
+    assert sums[1] == repo.get_multi_period_sums([1], periods)
+    assert sums[2] == repo.get_multi_period_sums([2], periods)
+    assert sums[9] == {"early": 0.0, "total": 0.0}
+
+
+@pytest.mark.parametrize("day", [date(1970, 1, 1), date(2024, 2, 29), date(2026, 3, 29)])
+def test_day_boundaries_match_utc_timestamps(day: date) -> None:
+    """Test that integer day boundaries equal the UTC datetime timestamps."""
+    start = datetime(day.year, day.month, day.day, tzinfo=UTC)
+    end = datetime(day.year, day.month, day.day, 23, 59, 59, 999999, tzinfo=UTC)
+
+    assert _date_to_epoch_milli(day) == int(start.timestamp() * 1000)
+    assert _date_to_end_of_day_epoch_milli(day) == int(end.timestamp() * 1000)
+
+
+def test_multi_period_sql_is_reused_for_same_shape() -> None:
+    """Test that periods with the same bounds share one SQL string."""
+    first, first_params = _period_bounds({"a": (1, 2), "total": (None, None)})
+    second, second_params = _period_bounds({"b": (3, 4), "all": (None, None)})
+
+    assert first == second
+    assert (first_params, second_params) == ([1, 2], [3, 4])
+    assert _build_multi_period_sql(first, "feature_id = ?") is _build_multi_period_sql(
+        second, "feature_id = ?"
+    )
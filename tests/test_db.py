@@ -0,0 +1,62 @@
+"""Tests for ThreadLocalDB connection pooling."""
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from quantify.services.db import ThreadLocalDB
+
+
+def _create_table(conn: sqlite3.Connection) -> None:
+    """Create the test schema."""
+    conn.execute("CREATE TABLE IF NOT EXISTS items (value INTEGER)")
+    conn.commit()
+
+
+def test_acquire_reuses_connection_across_threads(tmp_path: Path) -> None:
+    """Test that a connection released by one thread is reused by the next."""
+    db = ThreadLocalDB(tmp_path / "test.db", schema_init=_create_table)
+    seen: list[sqlite3.Connection] = []
+
+    def work() -> None:
+        with db.acquire() as conn:
+            conn.execute("INSERT INTO items VALUES (1)")
+            conn.commit()
+            seen.append(conn)
+
+    for _ in range(3):
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+    assert seen[0] is seen[1] is seen[2]
+    with db.acquire() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 3
+    db.close()
+
+
+def test_acquire_rolls_back_on_error(tmp_path: Path) -> None:
+    """Test that a failed block does not leave its changes pending."""
+    db = ThreadLocalDB(tmp_path / "test.db", schema_init=_create_table)
+
+    with pytest.raises(RuntimeError), db.acquire() as conn:
+        conn.execute("INSERT INTO items VALUES (1)")
+        raise RuntimeError("boom")
+
+    with db.acquire() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+    db.close()
+
+
+def test_bulk_execute_writes_all_chunks(tmp_path: Path) -> None:
+    """Test that rows spanning several chunks are all committed."""
+    db = ThreadLocalDB(tmp_path / "test.db", schema_init=_create_table)
+
+    db.bulk_execute("INSERT INTO items VALUES (?)", ((i,) for i in range(25)), chunk_size=10)
+
+    with db.acquire() as conn:
+        assert not conn.in_transaction
+        assert conn.execute("SELECT SUM(value) FROM items").fetchone()[0] == sum(range(25))
+    db.close()
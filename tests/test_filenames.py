@@ -0,0 +1,20 @@
+"""Tests for export filename helpers."""
+
+import pytest
+
+from quantify.export.filenames import safe_filename
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Work-Time_2024", "Work-Time_2024"),
+        ("Git: Lines Added", "Git__Lines_Added"),
+        ("a/b\\c.d", "a_b_c_d"),
+        ("Grüße & Café", "Grüße___Café"),
+        ("", ""),
+    ],
+)
+def test_safe_filename(name: str, expected: str) -> None:
+    """Test that unsafe characters are replaced and letters are kept."""
+    assert safe_filename(name) == expected
@@ -1,12 +1,16 @@
 """Tests for HtmlExporter."""
 
+import json
+import os
+import re
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from quantify.config.settings import ExportEntry, ExportSettings
 from quantify.export.html_exporter import HtmlExporter
+from quantify.export.stats_builder import build_chart_data
 from quantify.services.stats_calculator import TimeStats
 from quantify.sources.base import DataSource, SourceInfo
 from quantify.sources.registry import SourceRegistry
@@ -66,7 +70,7 @@ def setup_exporter(tmp_path: Path, mock_source: MagicMock) -> tuple[HtmlExporter
 {% for row in stats_rows %}
 <p>{{ row.period }}: {{ row.value }}</p>
 {% endfor %}
-<div data-labels='{{ chart_labels | tojson }}' data-values='{{ chart_values | tojson }}'></div>
+<div data-labels='{{ chart_labels_json }}' data-values='{{ chart_values_json }}'></div>
 <p>{{ generated_at }}</p>
 </body>
 </html>"""
@@ -169,6 +173,33 @@ def test_export_html_contains_stats(
     assert "Last 7 days" in content
 
 
+def test_export_embeds_chart_data_as_json(
+    setup_exporter: tuple[HtmlExporter, Path],
+    mock_stats: TimeStats,
+) -> None:
+    """Test that chart data attributes hold parseable JSON."""
+    exporter, tmp_path = setup_exporter
+    output_dir = tmp_path / "output"
+
+    export_settings = ExportSettings(
+        path=str(output_dir),
+        entries=(
+            ExportEntry(source="track_and_graph", entry_type="group", entry_id=1),
+        ),
+    )
+
+    generated = exporter.export(export_settings)
+    content = generated[1].read_text()
+
+    labels = re.search(r"data-labels='([^']*)'", content)
+    values = re.search(r"data-values='([^']*)'", content)
+    assert labels is not None
+    assert values is not None
+    expected_labels, expected_values = build_chart_data(mock_stats, None)
+    assert json.loads(labels.group(1)) == expected_labels
+    assert json.loads(values.group(1)) == expected_values
+
+
 def test_export_skips_missing_sources(
     tmp_path: Path,
 ) -> None:
@@ -270,3 +301,96 @@ def test_export_hometrainer_format(
     # Should use distance format (km) not time format (h m)
     assert "km" in content
     assert "Hometrainer" in content
+
+
+def test_export_preserves_entry_order(
+    setup_exporter: tuple[HtmlExporter, Path],
+) -> None:
+    """Test that generated files follow the configured entry order."""
+    exporter, tmp_path = setup_exporter
+    output_dir = tmp_path / "output"
+
+    entry_ids = [5, 3, 8, 1]
+    export_settings = ExportSettings(
+        path=str(output_dir),
+        entries=tuple(
+            ExportEntry(source="track_and_graph", entry_type="group", entry_id=entry_id)
+            for entry_id in entry_ids
+        ),
+    )
+
+    generated = exporter.export(export_settings)
+
+    assert [path.name.split("_")[4] for path in generated[1:]] == ["5", "3", "8", "1"]
+
+
+def test_export_resolves_each_source_once(
+    setup_exporter: tuple[HtmlExporter, Path],
+) -> None:
+    """Test that entries sharing a source look it up in the registry once."""
+    exporter, tmp_path = setup_exporter
+    output_dir = tmp_path / "output"
+
+    export_settings = ExportSettings(
+        path=str(output_dir),
+        entries=tuple(
+            ExportEntry(source="track_and_graph", entry_type="group", entry_id=entry_id)
+            for entry_id in (1, 2, 3)
+        ),
+    )
+
+    registry = exporter._registry
+    with patch.object(registry, "get_by_id", wraps=registry.get_by_id) as get_by_id:
+        generated = exporter.export(export_settings)
+
+    assert len(generated) == 4
+    get_by_id.assert_called_once_with("track_and_graph")
+
+
+def test_export_looks_up_item_names_once(
+    setup_exporter: tuple[HtmlExporter, Path],
+    mock_source: MagicMock,
+) -> None:
+    """Test that repeated entries for the same item reuse its name."""
+    exporter, tmp_path = setup_exporter
+    output_dir = tmp_path / "output"
+
+    export_settings = ExportSettings(
+        path=str(output_dir),
+        entries=(
+            ExportEntry(source="track_and_graph", entry_type="group", entry_id=1),
+            ExportEntry(
+                source="track_and_graph", entry_type="group", entry_id=1, title="Again"
+            ),
+        ),
+    )
+
+    exporter.export(export_settings)
+
+    mock_source.get_item_name.assert_called_once_with(1, "group")
+
+
+def test_export_updates_stale_static_files(
+    setup_exporter: tuple[HtmlExporter, Path],
+) -> None:
+    """Test that static files are re-copied only when the source is newer."""
+    exporter, tmp_path = setup_exporter
+    output_dir = tmp_path / "output"
+    export_settings = ExportSettings(path=str(output_dir), entries=())
+
+    exporter.export(export_settings)
+    copied_css = output_dir / "css" / "stats.css"
+    copied_css.write_text("/* edited */")
+
+    # Destination is newer than the source: left untouched
+    exporter.export(export_settings)
+    assert copied_css.read_text() == "/* edited */"
+
+    # Source changes after the copy: copied again
+    src_css = tmp_path / "static" / "css" / "stats.css"
+    src_css.write_text("body { padding: 0; }")
+    dst_mtime = copied_css.stat().st_mtime
+    os.utime(src_css, (dst_mtime + 10, dst_mtime + 10))
+
+    exporter.export(export_settings)
+    assert copied_css.read_text() == "body { padding: 0; }"
@@ -0,0 +1,39 @@
+"""Tests for MonthlyStats."""
+
+import pytest
+
+from quantify.services.monthly_stats import MonthlyStats
+
+
+@pytest.fixture
+def monthly_stats() -> MonthlyStats:
+    """Create monthly stats with a partial and a full year."""
+    return MonthlyStats(
+        data={
+            2025: {1: 10.0, 3: 30.5, 12: 120.0},
+            2024: {month: float(month) for month in range(1, 13)},
+        },
+        years=(2025, 2024),
+        unit_label="EUR",
+    )
+
+
+def test_get_month_values_fills_missing_months(monthly_stats: MonthlyStats) -> None:
+    """Test that months without data are reported as 0.0."""
+    values = monthly_stats.get_month_values(2025)
+
+    assert len(values) == 12
+    assert values[0] == 10.0
+    assert values[1] == 0.0
+    assert values[2] == 30.5
+    assert values[11] == 120.0
+
+
+def test_get_values_matrix_matches_month_values(monthly_stats: MonthlyStats) -> None:
+    """Test that the matrix rows follow the requested year order."""
+    years = [2024, 2023, 2025]
+
+    matrix = monthly_stats.get_values_matrix(years)
+
+    assert matrix == [monthly_stats.get_month_values(year) for year in years]
+    assert matrix[1] == [0.0] * 12
@@ -0,0 +1,42 @@
+"""Tests for SourceRegistry."""
+
+from unittest.mock import MagicMock
+
+from quantify.sources.base import DataSource
+from quantify.sources.registry import SourceRegistry
+
+
+def _make_source(configured: bool) -> MagicMock:
+    """Create a mock DataSource."""
+    source = MagicMock(spec=DataSource)
+    source.is_configured.return_value = configured
+    return source
+
+
+def test_factory_is_called_once_on_first_use() -> None:
+    """Test that a factory source is created lazily and then reused."""
+    source = _make_source(configured=True)
+    factory = MagicMock(return_value=source)
+    registry = SourceRegistry()
+
+    registry.register_factory("hometrainer", factory)
+    factory.assert_not_called()
+
+    assert registry.get_by_id("hometrainer") is source
+    assert registry.get_all() == [source]
+    factory.assert_called_once()
+
+
+def test_has_configured_sources_stops_at_first_match() -> None:
+    """Test that later factories are not called once a configured source is found."""
+    first = _make_source(configured=True)
+    later_factory = MagicMock(return_value=_make_source(configured=True))
+    registry = SourceRegistry()
+    registry.register_factory("track_and_graph", lambda: first)
+    registry.register_factory("git_stats", later_factory)
+
+    assert registry.has_configured_sources()
+    later_factory.assert_not_called()
+
+    registry.close_all()
+    first.close.assert_called_once()
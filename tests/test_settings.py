@@ -1,5 +1,6 @@
 """Tests for Settings."""
 
+import os
 from pathlib import Path
 
 import pytest
@@ -50,3 +51,19 @@ def test_valid_legacy_format_loads(tmp_path: Path) -> None:
 
     settings = Settings.load(tmp_path)
     assert settings.db_path == "test.db"
+
+
+def test_load_reuses_settings_until_file_changes(tmp_path: Path) -> None:
+    """Test that an unchanged config is not parsed again, but an edited one is."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"db_path": "test.db"}')
+
+    first = Settings.load(tmp_path)
+    assert Settings.load(tmp_path) is first
+
+    config_path.write_text('{"db_path": "other.db"}')
+    os.utime(config_path, ns=(0, 0))
+
+    reloaded = Settings.load(tmp_path)
+    assert reloaded is not first
+    assert reloaded.db_path == "other.db"
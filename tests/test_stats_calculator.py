@@ -0,0 +1,76 @@
+"""Tests for StatsCalculator."""
+
+from datetime import date
+
+from quantify.services.stats_calculator import (
+    StatsCalculator,
+    _compute_date_ranges,
+    _compute_day_counts,
+)
+
+
+def _days_in_range(start: date | None, end: date | None) -> float:
+    """Sum one unit per day, counting from 2020-01-01 when unbounded."""
+    start = start or date(2020, 1, 1)
+    end = end or date(2026, 3, 15)
+    return float(max((end - start).days + 1, 0))
+
+
+def test_date_ranges_are_shared_for_the_same_day() -> None:
+    """Test that repeated calls for one day reuse the computed boundaries."""
+    today = date(2026, 3, 15)
+
+    assert _compute_date_ranges(today) is _compute_date_ranges(today)
+    assert _compute_date_ranges(date(2026, 3, 16))["today"] == date(2026, 3, 16)
+
+
+def test_batched_sums_match_single_sums() -> None:
+    """Test that get_sums() gives the same stats as one get_sum() per period."""
+    calculator = StatsCalculator()
+    ranges = _compute_date_ranges(date(2026, 3, 15))
+
+    def get_sums(periods: dict[str, tuple[date | None, date | None]]) -> dict[str, float]:
+        return {name: _days_in_range(start, end) for name, (start, end) in periods.items()}
+
+    single = calculator.calculate(_days_in_range, ranges=ranges)
+    batched = calculator.calculate(_days_in_range, get_sums=get_sums, ranges=ranges)
+
+    assert batched == single
+    assert single.last_7_days == 8.0
+    assert single.yearly_totals[0] == (2026, 74.0)
+
+
+def test_yearly_totals_share_ranges_with_periods() -> None:
+    """Test that yearly totals reuse sums of identical period ranges."""
+    calculator = StatsCalculator()
+    ranges = _compute_date_ranges(date(2026, 3, 15))
+    calls: list[tuple[date | None, date | None]] = []
+
+    def get_sum(start: date | None, end: date | None) -> float:
+        calls.append((start, end))
+        return _days_in_range(start, end)
+
+    stats = calculator.calculate(get_sum, num_years=4, ranges=ranges)
+
+    assert len(calls) == len(set(calls))
+    assert (date(2023, 1, 1), date(2023, 12, 31)) in calls
+    assert stats.total_last_year == 365.0
+    assert [year for year, _ in stats.yearly_totals] == [2026, 2025, 2024, 2023]
+
+
+def test_periods_are_shared_for_the_same_day() -> None:
+    """Test that period ranges are computed once per day and year count."""
+    calculator = StatsCalculator()
+    ranges = _compute_date_ranges(date(2026, 3, 15))
+
+    assert calculator._get_periods(ranges, 3) is calculator._get_periods(ranges, 3)
+    assert "year_2023" in calculator._get_periods(ranges, 4)
+
+
+def test_day_counts_use_actual_year_lengths() -> None:
+    """Test that per-day divisors include both ends and leap days."""
+    assert _compute_day_counts(date(2025, 1, 1)) == {
+        "last_12_months": 366,
+        "this_year": 1,
+        "last_year": 366,
+    }